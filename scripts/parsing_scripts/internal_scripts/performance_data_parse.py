@@ -10,22 +10,38 @@ This script is called by the central parse_results.py controller and supports si
 
 #------------------------------------------------------------------------------------------------------------------------------
 import pandas as pd
+import numpy as np
+import csv
+import io
+import mmap
 import re
 import os
 import sys
 import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from internal_scripts.results_averager import ComputationalAverager
 
+# Use the PyArrow CSV reader for the speed files if it is available, falling back to the pandas C parser if not
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
+#------------------------------------------------------------------------------------------------------------------------------
+# Precompiled pattern for extracting the peak snapshot index from the massif detailed snapshots line
+_PEAK_RE = re.compile(rb" Detailed snapshots: \[[^\]]*?(\d+) \(peak\)")
+
+# Characters deleted from the massif snapshot rows before splitting (the thousands separators)
+_COMMA_STRIP = b","
+
 #------------------------------------------------------------------------------------------------------------------------------
 def setup_parse_env(root_dir):
     """ Function for setting up the environment for parsing computational performance results.
         The function will set the various directory paths, read in the algorithm 
         lists and set the root directories. """
 
-    # Declare the algorithm list and directory paths dict variables
-    kem_algs = []
-    sig_algs = []
+    # Declare the directory paths dict variable
     dir_paths = {}
 
     # Ensure the root_dir path is correct before continuing
@@ -42,16 +58,13 @@ def setup_parse_env(root_dir):
     kem_algs_file = os.path.join(root_dir, "test_data", "alg_lists", "kem_algs.txt")
     sig_algs_file = os.path.join(root_dir, "test_data", "alg_lists", "sig_algs.txt")
 
-    # Read in the algorithms from the KEM alg-list file
+    # Read in the algorithms from the KEM alg-list file (one algorithm per line)
     with open(kem_algs_file, "r") as kem_file:
-        for line in kem_file:
-            kem_algs.append(line.strip())
+        kem_algs = kem_file.read().split()
     
-    # Read in the algorithms from the sig alg-list file
+    # Read in the algorithms from the sig alg-list file (one algorithm per line)
     with open(sig_algs_file, "r") as alg_file:
-        for line in alg_file:
-            sig_algs.append(line.strip())
-
+        sig_algs = alg_file.read().split()
 
     # Return the algorithm lists and directory paths
     return kem_algs, sig_algs, dir_paths
@@ -74,7 +87,7 @@ def handle_results_dir_creation(machine_id, dir_paths, replace_old_results):
 
             # Remove the old results directory automatically for current Machine-ID
             print(f"Removing old results directory for Machine-ID ({machine_id}) before continuing...\n")
-            shutil.rmtree(dir_paths["results_dir"], f"machine_{machine_id}")
+            shutil.rmtree(dir_paths["mach_results_dir"], ignore_errors=True)
 
             # Create the new directories for parsed results
             os.makedirs(dir_paths["type_speed_dir"])
@@ -99,7 +112,7 @@ def handle_results_dir_creation(machine_id, dir_paths, replace_old_results):
 
                     # Replace all old results and create a new empty directory to store the parsed results
                     print(f"Removing old results directory for Machine-ID ({machine_id}) before continuing...\n")
-                    shutil.rmtree(dir_paths["results_dir"], f"machine_{machine_id}")
+                    shutil.rmtree(dir_paths["mach_results_dir"], ignore_errors=True)
 
                     # Create the new directories for parsed results
                     os.makedirs(dir_paths["type_speed_dir"])
@@ -157,270 +170,251 @@ def check_data_mismatch(df_len, alg_list_len, context):
         sys.exit(1)
 
 #------------------------------------------------------------------------------------------------------------------------------
-def get_peak(mem_file, peak_metrics):
+def get_peak(mem_file):
     """ Helper function for taking the passed massif.out file and getting 
         the peak memory metrics, returning the values to continue
         processing. The function comes from the run_mem.py script 
         found in the OQS Profiling Project
         https://github.com/open-quantum-safe/profiling """
 
-    # Get the peak memory metric for the current algorithm's cryptographic operation
-    with open(mem_file, "r") as lines:
-        peak = -1
-        for line in lines:
-            if line.startswith(" Detailed snapshots: ["):
-                match=re.search(r"\d+ \(peak\).*", line)
-                if match:
-                    peak = int(match.group(0).split()[0])      
-            if (peak > 0):
-                
-                if line.startswith('{: >3d}'.format(peak)): # remove "," and print all numbers except first:
-                    nl = line.replace(",", "")
-                    peak_metrics = nl.split()
-                    del peak_metrics[0]
-                    return peak_metrics
+    # Memory-map the massif output so it can be scanned with C-level byte searches without reading it line by line
+    with open(mem_file, "rb") as mem_output:
 
-#------------------------------------------------------------------------------------------------------------------------------
-def pre_speed_processing(dir_paths, num_runs):
-    """ Function for preparing speed up-result data by removing system information, 
-        making it ready for further processing. """
+        # Empty files can not be mapped and contain no metrics
+        if os.fstat(mem_output.fileno()).st_size == 0:
+            return None
+        
+        with mmap.mmap(mem_output.fileno(), 0, access=mmap.ACCESS_READ) as data:
 
-    # Setup the destination directory in the current machine's up-results for pre-processed speed files
-    if not os.path.exists(dir_paths['up_speed_dir']):
-        os.makedirs(dir_paths['up_speed_dir'])
-    else:
-        shutil.rmtree(dir_paths["up_speed_dir"])
-        os.makedirs(dir_paths['up_speed_dir'])
+            # Get the peak snapshot index from the detailed snapshots line
+            match = _PEAK_RE.search(data)
+            if match is None:
+                return None
+            peak = int(match.group(1))
+            if peak <= 0:
+                return None
 
-    # Setting the initial prefix variables for KEM and sig files
-    kem_prefix = "test_kem_speed_"
-    sig_prefix = "test_sig_speed_"
+            # Jump straight to the peak snapshot row in the table that follows the detailed snapshots line
+            snapshot = re.compile(rb"^ *%d +(.+)$" % peak, re.M).search(data, match.end())
+            if snapshot is None:
+                return None
 
-    # Pre-format the KEM and sig csv speed files to remove system information from the file
-    for run_count in range(1, num_runs+1):
+            # Remove "," with a single translate pass over the matched row, then decode and return all numbers except the snapshot index
+            peak_metrics = snapshot.group(1).translate(None, _COMMA_STRIP).decode().split()
+            return peak_metrics
 
-        """ Pre-format the kem CSV files """
-        # Set the filename based on current run
-        kem_pre_filename = kem_prefix + str(run_count) + ".csv"
-        kem_filename = os.path.join(dir_paths["raw_speed_dir"], kem_pre_filename)
+#------------------------------------------------------------------------------------------------------------------------------
+def get_peak_worker(mem_filepath):
+    """ Helper function used by the memory processing thread pool to parse a single massif output file. Errors caused 
+        by malformed file content are returned rather than raised so that they can be reported against the file they 
+        came from, any other error is treated as a genuine failure and raised. """
 
-        # Read in the results file
-        with open(kem_filename, 'r') as pre_file:
-            rows = pre_file.readlines()
+    # Get the peak metrics for the file, passing back the error if the file content could not be parsed
+    try:
+        return get_peak(mem_filepath), None
+    except (ValueError, IndexError) as e:
+        return None, e
 
-        # Get the header start index and format the file
-        header_line_index = next(row_index for row_index, line in enumerate(rows) if line.startswith('Operation'))
-        kem_pre_speed_df = pd.read_csv(kem_filename, skiprows=range(header_line_index), skipfooter=1, delimiter='|', engine='python')
-        kem_pre_speed_df = kem_pre_speed_df.iloc[1:]
+#------------------------------------------------------------------------------------------------------------------------------
+def read_speed_table(speed_source):
+    """ Helper function for parsing the Liboqs speed results table from a binary file object positioned at the table 
+        header. The PyArrow CSV reader is used when installed, otherwise the pandas C parser is used. The table separator 
+        row and the trailing footer line are removed before the dataframe is returned. """
+
+    # Parse the table with PyArrow, skipping the footer line as it does not contain the table delimiters
+    if pacsv is not None:
+        speed_table = pacsv.read_csv(
+            speed_source,
+            parse_options=pacsv.ParseOptions(delimiter='|', invalid_row_handler=lambda row: "skip")
+        )
+        speed_df = speed_table.to_pandas().iloc[1:]
 
-        # Write out the pre_formatted file to up-results speed dir
-        speed_dest_dir = os.path.join(dir_paths["up_speed_dir"], kem_pre_filename)
-        kem_pre_speed_df.to_csv(speed_dest_dir, index=False, sep="|")
+    else:
 
-        """ Pre-format the Digital Signature CSV files """
-        # Set the filename based on the current run
-        sig_pre_filename = sig_prefix + str(run_count) + ".csv"
-        sig_filename = os.path.join(dir_paths["raw_speed_dir"], sig_pre_filename)
+        # Parse the table with pandas, where the footer line is parsed as a single field row and must be removed
+        speed_df = pd.read_csv(speed_source, delimiter='|', engine='c').iloc[1:-1]
 
-        # Read in the file
-        with open(sig_filename, 'r') as pre_file:
-            rows = pre_file.readlines()
+    return speed_df.reset_index(drop=True)
 
-        # Get the header start index and format the file
-        header_line_index = next(i for i, line in enumerate(rows) if line.startswith('Operation'))
-        sig_pre_speed_df = pd.read_csv(sig_filename, skiprows=range(header_line_index), skipfooter=1, delimiter='|', engine='python')
-        sig_pre_speed_df = sig_pre_speed_df.iloc[1:]
+#------------------------------------------------------------------------------------------------------------------------------
+def load_raw_speed_file(speed_filepath):
+    """ Helper function for reading a raw Liboqs speed output file in a single pass. Only the first block of the file 
+        is read to locate the results table header, the file is then seeked to the header and the rest is streamed 
+        straight into the table parser, skipping the system information without a separate read of the file. """
 
-        # Write out the pre-formatted file to up-results speed dir
-        speed_dest_dir = os.path.join(dir_paths["up_speed_dir"], sig_pre_filename)
-        sig_pre_speed_df.to_csv(speed_dest_dir, index=False, sep="|")
+    # Open the results file in binary mode so the header can be located by byte offset
+    with open(speed_filepath, 'rb') as speed_file:
 
-#------------------------------------------------------------------------------------------------------------------------------
-def speed_processing(dir_paths, num_runs, kem_algs, sig_algs):
-    """ Function for processing CPU speed up-results and exporting the data 
-        into a clean CSV format. """
+        # Locate the start of the results table header line within the first block of the file
+        head = speed_file.read(8192)
+        header_offset = 0 if head.startswith(b"Operation") else head.find(b"\nOperation") + 1
 
-    # Set the filename prefix variables
-    kem_prefix = "test_kem_speed_"
-    sig_prefix = "test_sig_speed_"
+        # Move to the header and load the results table into a dataframe if it was found in the first block
+        if header_offset != 0 or head.startswith(b"Operation"):
+            speed_file.seek(header_offset)
+            speed_df = read_speed_table(speed_file)
 
-    # Create the algorithm lists to insert into new header column
-    new_col_kem = [alg for alg in kem_algs for _ in range(3)]
-    new_col_sig = [alg for alg in sig_algs for _ in range(3)]
-    
-    # Read the original csv files and format them
-    for file_count in range(1, num_runs+1):
+        else:
 
-        """ Format the KEM Files """
-        # Load the KEM file into a dataframe
-        filename_kem_pre = kem_prefix + str(file_count) + ".csv"
-        filename_kem_pre = os.path.join(dir_paths['up_speed_dir'], filename_kem_pre)
-        temp_df = pd.read_csv(filename_kem_pre, delimiter="|", index_col=False)
+            # Fall back to searching the whole file if the system information is unusually long
+            data = head + speed_file.read()
+            header_offset = data.find(b"\nOperation") + 1
 
-        # Perform the initial value whitespace strip 
-        temp_df.columns = temp_df.columns.str.strip()
+            # Ensure the results table header is present before continuing
+            if header_offset == 0:
+                print(f"[ERROR] - Could not find the results table header in the speed file - {speed_filepath}")
+                sys.exit(1)
 
-        # Determine which pandas mapping method to use and strip the trailing spaces in the dataframe cells
-        if hasattr(temp_df, "map"):
-            temp_df = temp_df.map(lambda value: value.strip() if isinstance(value, str) else value)
-        elif hasattr(temp_df, "applymap"):
-            temp_df = temp_df.applymap(lambda value: value.strip() if isinstance(value, str) else value)
-        else:
-            print(f"[ERROR] - The version of pandas available to the parsing scripts is not supported")
-            sys.exit(1)
+            # Parse the already read data from the header onwards rather than reading the file from disk again
+            speed_df = read_speed_table(io.BytesIO(data[header_offset:]))
 
-        # Remove the algorithms from the Operation column
-        temp_df = temp_df.loc[~temp_df['Operation'].isin(kem_algs)]
+    return speed_df
 
-        # Check if there is a mismatch between the number of algorithms in the alg-list and the dataframe
-        check_data_mismatch(len(temp_df), len(kem_algs), "KEM Speed Results")
+#------------------------------------------------------------------------------------------------------------------------------
+def speed_type_processing(dir_paths, num_runs, algs, alg_type):
+    """ Function for processing the raw CPU speed up-results for a single algorithm type (KEM or sig) and exporting the 
+        data into a clean CSV format. Each raw file is read once, has its system information removed, is formatted, 
+        and is then written out to the parsed results directory. """
+
+    # Set the filename prefix and the label used in the mismatch error output for the algorithm type
+    file_prefix = f"test_{alg_type}_speed_"
+    type_label = "KEM" if alg_type == "kem" else "Sig"
+
+    # Create the algorithm array to insert into new header column and the set used for filtering algorithm rows
+    new_alg_col = np.repeat(np.asarray(algs), 3)
+    alg_set = set(algs)
+    
+    # Read the raw csv files and format them
+    for file_count in range(1, num_runs+1):
 
-        # Insert the new algorithm column and output the formatted csv
-        temp_df.insert(0, "Algorithm", new_col_kem)
-        filename_kem = kem_prefix + str(file_count) + ".csv"
-        filename_kem = os.path.join(dir_paths['type_speed_dir'], filename_kem)
-        temp_df.to_csv(filename_kem, index=False)
-        
-        """ Formatting the Digital Signature Files """
-        # Load the kem file into a dataframe and strip the trailing spaces in column headers
-        filename_sig_pre = sig_prefix + str(file_count) + ".csv"
-        filename_sig_pre = os.path.join(dir_paths['up_speed_dir'], filename_sig_pre)
-        temp_df = pd.read_csv(filename_sig_pre, delimiter="|", index_col=False)
+        # Load the raw file into a dataframe with the system information removed
+        filename_raw = file_prefix + str(file_count) + ".csv"
+        filename_raw = os.path.join(dir_paths['raw_speed_dir'], filename_raw)
+        temp_df = load_raw_speed_file(filename_raw)
 
-        # Perform the initial value whitespace strip 
-        temp_df.columns = temp_df.columns.str.strip()
+        # Strip the Operation column (always the first column) once and use it to remove the algorithm name rows
+        op_col = temp_df.columns[0]
+        op_stripped = temp_df[op_col].str.strip()
+        alg_mask = ~op_stripped.map(alg_set.__contains__)
+        temp_df = temp_df.loc[alg_mask].copy()
 
-        # Determine which pandas mapping method to use and strip the trailing spaces in the dataframe cells
-        if hasattr(temp_df, "map"):
-            temp_df = temp_df.map(lambda value: value.strip() if isinstance(value, str) else value)
-        elif hasattr(temp_df, "applymap"):
-            temp_df = temp_df.applymap(lambda value: value.strip() if isinstance(value, str) else value)
-        else:
-            print(f"[ERROR] - The version of pandas available to the parsing scripts is not supported")
-            sys.exit(1)
+        # Strip the trailing spaces in the remaining string columns and reuse the already stripped Operation values (done 
+        # before the header strip as the raw column names are guaranteed unique, whereas the stripped ones contain duplicates)
+        obj_cols = temp_df.select_dtypes(include=["object", "string"]).columns.drop(op_col)
+        temp_df[obj_cols] = temp_df[obj_cols].apply(lambda col: col.str.strip())
+        temp_df[op_col] = op_stripped[alg_mask]
 
-        # Remove the algorithms from the Operation column
-        temp_df = temp_df.loc[~temp_df['Operation'].isin(sig_algs)]
+        # Strip the whitespace from the column headers
+        temp_df.columns = temp_df.columns.str.strip()
 
         # Check if there is a mismatch between the number of algorithms in the alg-list and the dataframe
-        check_data_mismatch(len(temp_df), len(sig_algs), "Sig Speed Results")
+        check_data_mismatch(len(temp_df), len(algs), f"{type_label} Speed Results")
 
         # Insert the new algorithm column and output the formatted csv
-        temp_df.insert(0, 'Algorithm', new_col_sig)
-        filename_sig = sig_prefix + str(file_count) + ".csv"
-        filename_sig = os.path.join(dir_paths['type_speed_dir'], filename_sig)
-        temp_df.to_csv(filename_sig, index=False)
+        temp_df.insert(0, "Algorithm", new_alg_col)
+        filename_out = file_prefix + str(file_count) + ".csv"
+        filename_out = os.path.join(dir_paths['type_speed_dir'], filename_out)
+        temp_df.to_csv(filename_out, index=False)
 
 #------------------------------------------------------------------------------------------------------------------------------
-def memory_processing(dir_paths, num_runs, kem_algs, sig_algs, alg_operations):
-    """ Function for taking in the memory up-results, processing,
+def speed_processing(dir_paths, num_runs, kem_algs, sig_algs):
+    """ Function for processing the CPU speed up-results for both KEM and sig algorithms. The two algorithm types 
+        are fully independent, so they are processed in separate processes as the work is pandas heavy and GIL bound. """
+
+    # Process the KEM and sig speed results in parallel and wait for both to complete, raising any worker errors
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(speed_type_processing, dir_paths, num_runs, kem_algs, "kem"),
+            executor.submit(speed_type_processing, dir_paths, num_runs, sig_algs, "sig")
+        ]
+        for future in futures:
+            future.result()
+
+#------------------------------------------------------------------------------------------------------------------------------
+def memory_type_processing(dir_paths, num_runs, algs, alg_type, operations):
+    """ Function for taking in the memory up-results for a single algorithm type (KEM or sig), processing,
         and outputting the results into a CSV format """
 
-    # Set the un-parsed memory results directory variables
-    kem_up_dir = os.path.join(dir_paths["up_mem_dir"], "kem_mem_metrics")
-    sig_up_dir = os.path.join(dir_paths["up_mem_dir"], "sig_mem_metrics")
+    # Set the un-parsed memory results directory and the path prefix used to build the file paths
+    up_dir = os.path.join(dir_paths["up_mem_dir"], f"{alg_type}_mem_metrics")
+    up_prefix = up_dir + os.sep
+    type_label = "KEM" if alg_type == "kem" else "Sig"
 
-    # Declare the list variables used in memory processing
-    new_row = []
-    peak_metrics = []
+    # List the memory up-results directory once so missing files can be skipped without attempting to open them
+    up_files = {entry.name for entry in os.scandir(up_dir)} if os.path.isdir(up_dir) else set()
 
-    # Define the header column names for the dataframe
+    # Define the header column names for the output CSV files
     fieldnames = ["Algorithm", "Operation", "intits", "peakBytes", "Heap", "extHeap", "Stack"]
-    
-    # Loop through the number of test runs specified
-    for run_count in range(1, num_runs+1):
-
-        # Create the dataframe to store memory metrics for the current run
-        mem_results_df = pd.DataFrame(columns=fieldnames)
-
-        # Loop through the KEM algorithms
-        for kem_alg in kem_algs:
-
-            # Loop through the cryptographic operations and add to the temp dataframe 
-            for operation in range(0,3,1):
-
-                # Parse the metrics and add the results to dataframe row
-                kem_up_filename = kem_alg + "_" + str(operation) + "_" + str(run_count) + ".txt"
-                kem_up_filepath = os.path.join(kem_up_dir, kem_up_filename)
-
-                try:
 
-                    # Create peak memory metrics list for current KEM algorithm and setup the new row
-                    peak_metrics = get_peak(kem_up_filepath, peak_metrics)
-                    new_row.extend([kem_alg, alg_operations['kem_operations'][operation]])
-
-                    # Assign empty values for the algorithm/operation row if no memory metrics were gathered
-                    if peak_metrics is None:
-                        peak_metrics = []
-                        for _ in range(1, (len(fieldnames) - 2)):
-                            peak_metrics.append("")
-                    
-                    # Fill in the row with algorithm/operation memory metrics before appending to the dataframe
-                    new_row.extend(peak_metrics)
-                    mem_results_df.loc[len(mem_results_df)] = new_row
-
-                    # Clear the metric and row lists
-                    peak_metrics.clear()
-                    new_row.clear()
-                
-                except Exception as e:
-                    print(f"\nKEM algorithm memory parsing error, run - {run_count}")
-                    print(f"error - {e}")
-                    print(f"Filename {kem_up_filename}\n")
-                    
-        # Check if there is a mismatch between the number of algorithms in the alg-list and the dataframe
-        check_data_mismatch(len(mem_results_df), len(kem_algs), "KEM Memory Results")
-        
-        # Output the KEM CSV file for this run
-        kem_filename = "kem_mem_metrics_" + str(run_count) + ".csv"
-        kem_filepath = os.path.join(dir_paths["type_mem_dir"], kem_filename)
-        mem_results_df.to_csv(kem_filepath, index=False)
-
-        # Reinitialise the memory results dataframe for the next algorithm
-        mem_results_df = pd.DataFrame(columns=fieldnames)
-
-        # Loop through the digital signature algorithms
-        for sig_alg in sig_algs:
-
-            # Loop through the cryptographic operations and add to the temp dataframe 
-            for operation in range(0,3,1):
-
-                # Parse the metrics and add the results to dataframe row
-                sig_up_filename = sig_alg + "_" + str(operation) + "_" + str(run_count) + ".txt"
-                sig_up_filepath = os.path.join(sig_up_dir, sig_up_filename)
-
-                try:
-
-                    # Create peak memory metrics list for current sig algorithm and setup the new row
-                    peak_metrics = get_peak(sig_up_filepath, peak_metrics)
-                    new_row.extend((sig_alg, alg_operations['sig_operations'][operation]))
-
-                    # Assign empty values for the algorithm/operation row if no memory metrics were gathered
-                    if peak_metrics is None:
-                        peak_metrics = []
-                        for _ in range(0, (len(fieldnames) - 2)):
-                            peak_metrics.append("")
-                        
-                    # Fill in the row with algorithm/operation memory metrics before appending to the dataframe
-                    new_row.extend(peak_metrics)
-                    mem_results_df.loc[len(mem_results_df)] = new_row
-
-                    # Clear the metric and row lists
-                    peak_metrics.clear()
-                    new_row.clear()
+    # Create the thread pool used to overlap the file reads of the independent massif output files
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    
+        # Loop through the number of test runs specified
+        for run_count in range(1, num_runs+1):
+
+            # Create the list to collect the memory metric rows for the current run
+            mem_rows = []
+
+            # Build the list of algorithm/operation files for the current run
+            mem_tasks = []
+            for alg in algs:
+                for operation in range(0,3,1):
+
+                    # Set the filename and skip the row if the file is not present in the up-results directory
+                    up_filename = f"{alg}_{operation}_{run_count}.txt"
+                    if up_filename not in up_files:
+                        print(f"\n{type_label} algorithm memory parsing error, run - {run_count}")
+                        print(f"error - missing file")
+                        print(f"Filename {up_filename}\n")
+                        continue
+
+                    # Add the algorithm/operation file to the task list using the precomputed path prefix
+                    mem_tasks.append((alg, operation, up_filename, f"{up_prefix}{up_filename}"))
+
+            # Parse the files in parallel, with the results returned in the same order as the tasks
+            mem_results = executor.map(get_peak_worker, [task[3] for task in mem_tasks])
+
+            # Loop through the parsed results and add them to the rows list
+            for (alg, operation, up_filename, _), (peak_metrics, error) in zip(mem_tasks, mem_results):
+
+                # Output the error details and skip the row if the file content could not be parsed
+                if error is not None:
+                    print(f"\n{type_label} algorithm memory parsing error, run - {run_count}")
+                    print(f"error - {error}")
+                    print(f"Filename {up_filename}\n")
+                    continue
+
+                # Assign empty values for the algorithm/operation row if no memory metrics were gathered
+                if peak_metrics is None:
+                    peak_metrics = [""] * (len(fieldnames) - 2)
                 
-                except Exception as e:
-                    print(f"\nsig alg error, run - {run_count}")
-                    print(f"error - {e}")
-                    print(f"Filename {sig_up_filename}\n")
-
-        # Check if there is a mismatch between the number of algorithms in the alg-list and the dataframe
-        check_data_mismatch(len(mem_results_df), len(sig_algs), "Sig Memory Results")
+                # Fill in the row with algorithm/operation memory metrics before appending to the rows list
+                mem_rows.append([alg, operations[operation], *peak_metrics])
+
+            # Check if there is a mismatch between the number of algorithms in the alg-list and the collected rows
+            check_data_mismatch(len(mem_rows), len(algs), f"{type_label} Memory Results")
+            
+            # Output the CSV file for this run, writing the rows directly as no dataframe operations are needed
+            out_filename = f"{alg_type}_mem_metrics_{run_count}.csv"
+            out_filepath = os.path.join(dir_paths["type_mem_dir"], out_filename)
+            with open(out_filepath, "w", newline="") as out_file:
+                csv_writer = csv.writer(out_file, lineterminator="\n")
+                csv_writer.writerow(fieldnames)
+                csv_writer.writerows(mem_rows)
 
-        # Output the digital signature csv file for this run
-        sig_filename = "sig_mem_metrics_" + str(run_count) + ".csv"
-        sig_filepath = os.path.join(dir_paths["type_mem_dir"], sig_filename)
-        mem_results_df.to_csv(sig_filepath, index=False)
+#------------------------------------------------------------------------------------------------------------------------------
+def memory_processing(dir_paths, num_runs, kem_algs, sig_algs, alg_operations):
+    """ Function for processing the memory up-results for both KEM and sig algorithms, with the two independent 
+        algorithm types processed in separate processes. """
+
+    # Process the KEM and sig memory results in parallel and wait for both to complete, raising any worker errors
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(memory_type_processing, dir_paths, num_runs, kem_algs, "kem", alg_operations['kem_operations']),
+            executor.submit(memory_type_processing, dir_paths, num_runs, sig_algs, "sig", alg_operations['sig_operations'])
+        ]
+        for future in futures:
+            future.result()
 
 #------------------------------------------------------------------------------------------------------------------------------
 def process_tests(machine_id, num_runs, dir_paths, kem_algs, sig_algs, replace_old_results):
@@ -433,12 +427,19 @@ def process_tests(machine_id, num_runs, dir_paths, kem_algs, sig_algs, replace_o
     # Create an instance of the computational performance average generator class before processing results
     comp_avg = ComputationalAverager(dir_paths, kem_algs, sig_algs, num_runs, alg_operations)
 
+    # Set the machine's results and up-results directories once so they can be reused for the sub-directory paths
+    mach_dirname = f"machine_{machine_id}"
+    mach_results_dir = os.path.join(dir_paths['results_dir'], mach_dirname)
+    mach_up_results_dir = os.path.join(dir_paths['up_results'], mach_dirname)
+
     # Set the unparsed-directory paths in the central paths dictionary
-    dir_paths['up_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine_{str(machine_id)}", "speed_results")
-    dir_paths['up_mem_dir'] = os.path.join(dir_paths['up_results'], f"machine_{str(machine_id)}", "mem_results")
-    dir_paths['type_speed_dir'] = os.path.join(dir_paths['results_dir'], f"machine_{str(machine_id)}", "speed_results")
-    dir_paths['type_mem_dir'] = os.path.join(dir_paths['results_dir'], f"machine_{str(machine_id)}", "mem_results")
-    dir_paths['raw_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine_{str(machine_id)}", "raw_speed_results")
+    dir_paths.update({
+        'mach_results_dir': mach_results_dir,
+        'up_mem_dir': os.path.join(mach_up_results_dir, "mem_results"),
+        'type_speed_dir': os.path.join(mach_results_dir, "speed_results"),
+        'type_mem_dir': os.path.join(mach_results_dir, "mem_results"),
+        'raw_speed_dir': os.path.join(mach_up_results_dir, "raw_speed_results"),
+    })
 
     # Ensure that the machine's up-results directory exists before continuing
     if not os.path.exists(dir_paths['up_results']):
@@ -449,7 +450,6 @@ def process_tests(machine_id, num_runs, dir_paths, kem_algs, sig_algs, replace_o
     handle_results_dir_creation(machine_id, dir_paths, replace_old_results)
 
     # Parse the up-results for the specified Machine-ID
-    pre_speed_processing(dir_paths, num_runs)
     speed_processing(dir_paths, num_runs, kem_algs, sig_algs)
     memory_processing(dir_paths, num_runs, kem_algs, sig_algs, alg_operations)
 
@@ -45,6 +45,9 @@ class ComputationalAverager:
         kem_mem_avg = pd.DataFrame(columns=mem_fieldnames)
         sig_mem_avg = pd.DataFrame(columns=mem_fieldnames)
 
+        # Load each of the KEM memory run files once so they are not re-read from disk for every algorithm
+        kem_run_dfs = [pd.read_csv(kem_mem_file_prefix + str(run_count) + ".csv") for run_count in range(1, self.num_runs+1)]
+
         """ Calculate KEM Memory Averages """
         # Loop through the KEM algorithms
         for kem_alg in self.kem_algs:
@@ -55,9 +58,8 @@ class ComputationalAverager:
             # Loop through the results files for the number of test runs
             for run_count in range(1, self.num_runs+1):
 
-                # Set the filename and read the csv into dataframe
-                kem_mem_filename = kem_mem_file_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(kem_mem_filename)
+                # Get the already loaded dataframe for the current run
+                temp_df = kem_run_dfs[run_count-1]
 
                 # Get the operations for the current algorithm across all files into one
                 if run_count == 1:
@@ -82,6 +84,9 @@ class ComputationalAverager:
                 row.insert(1, operation)
                 kem_mem_avg.loc[len(kem_mem_avg)] = row
 
+        # Load each of the digital signature memory run files once so they are not re-read from disk for every algorithm
+        sig_run_dfs = [pd.read_csv(sig_mem_file_prefix + str(run_count) + ".csv") for run_count in range(1, self.num_runs+1)]
+
         """ Calculate the Digital Signature Memory Averages """
         # Loop through the digital signature algorithms
         for sig_alg in self.sig_algs:
@@ -92,9 +97,8 @@ class ComputationalAverager:
             # Loop through the run files
             for run_count in range(1, self.num_runs+1):
 
-                # Set the filename and read the csv into dataframe
-                sig_mem_filename = sig_mem_file_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(sig_mem_filename)
+                # Get the already loaded dataframe for the current run
+                temp_df = sig_run_dfs[run_count-1]
 
                 # Get the cryptographic operations for the current algorithm across all files into one
                 if run_count == 1:
@@ -136,13 +140,12 @@ class ComputationalAverager:
         sig_filename_prefix = os.path.join(self.dir_paths['type_speed_dir'], "test_sig_speed_")
         speed_fieldnames = []
 
-        # Get the fieldnames from the first file
-        test_filename = "test_kem_speed_1.csv"
-        test_filename = os.path.join(self.dir_paths['type_speed_dir'], test_filename)
+        # Load each of the KEM and digital signature speed run files once so they are not re-read from disk for every algorithm
+        kem_run_dfs = [pd.read_csv(kem_filename_prefix + str(run_count) + ".csv") for run_count in range(1, self.num_runs+1)]
+        sig_run_dfs = [pd.read_csv(sig_filename_prefix + str(run_count) + ".csv") for run_count in range(1, self.num_runs+1)]
 
-        # Load the test file into a dataframe and put the headers into a list
-        check_df = pd.read_csv(test_filename)
-        speed_fieldnames = check_df.columns.to_list()
+        # Get the fieldnames from the first KEM run file
+        speed_fieldnames = kem_run_dfs[0].columns.to_list()
 
         # Set the output dataframe headers
         kem_speed_avg = pd.DataFrame(columns=speed_fieldnames)
@@ -158,9 +161,8 @@ class ComputationalAverager:
             # Loop through the run files
             for run_count in range(1, self.num_runs+1):
 
-                # Set the filename and read the csv into dataframe
-                kem_filename = kem_filename_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(kem_filename)
+                # Get the already loaded dataframe for the current run
+                temp_df = kem_run_dfs[run_count-1]
 
                 # Get the algorithm cryptographic operations across all files into one
                 if run_count == 1:
@@ -195,9 +197,8 @@ class ComputationalAverager:
             # Loop through the run files
             for run_count in range(1, self.num_runs+1):
 
-                # Set the filename and read the csv into dataframe
-                sig_filename = sig_filename_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(sig_filename)
+                # Get the already loaded dataframe for the current run
+                temp_df = sig_run_dfs[run_count-1]
 
                 # Get the algorithm cryptographic operations across all files into one
                 if run_count == 1:
@@ -245,6 +246,24 @@ class TLSAverager:
         self.pqc_type_vars = pqc_type_vars
         self.col_headers = col_headers
 
+    #------------------------------------------------------------------------------
+    def read_results_file(self, csv_filepath):
+        """ Method for reading in a parsed results file, preferring the Feather or Parquet copy written alongside the 
+            CSV file if it is present and up to date, otherwise falling back to reading the CSV file """
+
+        # Set the base filepath used for the typed copies of the results file
+        base_filepath = os.path.splitext(csv_filepath)[0]
+
+        # Read the first typed copy that exists and is not older than the CSV file
+        for typed_filepath, typed_reader in ((base_filepath + ".feather", pd.read_feather), (base_filepath + ".parquet", pd.read_parquet)):
+            if os.path.isfile(typed_filepath) and os.path.getmtime(typed_filepath) >= os.path.getmtime(csv_filepath):
+                try:
+                    return typed_reader(typed_filepath)
+                except ImportError:
+                    pass
+
+        return pd.read_csv(csv_filepath)
+
     #------------------------------------------------------------------------------
     def gen_pqc_avgs(self):
         """ Method for taking in the provided PQC TLS handshake
@@ -273,9 +292,9 @@ class TLSAverager:
                     first_runs_used = self.num_runs
                     reused_runs_used = self.num_runs
 
-                    # Reset the combined sig dataframe
-                    sig_first_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
-                    sig_reused_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
+                    # Reset the lists used to collect the per-run rows for the current sig/kem combo
+                    sig_first_run_dfs = []
+                    sig_reused_run_dfs = []
 
                     # Loop through the runs
                     for current_run in range(1, self.num_runs+1):
@@ -285,23 +304,23 @@ class TLSAverager:
                         current_run_filepath = os.path.join(sig_path, current_run_filename)
 
                         # Read in the current run CSV to get metrics
-                        current_run_df = pd.read_csv(current_run_filepath)
+                        current_run_df = self.read_results_file(current_run_filepath)
 
                         # Extract the data for the current KEM
-                        kem_df = current_run_df[current_run_df["KEM Algorithm"].str.contains(kem, regex=False)]
+                        kem_df = current_run_df[current_run_df["KEM Algorithm"] == kem]
 
-                        # Separate the data into combined dataframes
-                        if current_run == 1:
-                            sig_first_combined_df = kem_df.iloc[0:1]
-                            sig_reused_combined_df = kem_df.iloc[1:2]
-                        else:
-                            sig_first_combined_df = pd.concat([sig_first_combined_df, kem_df.iloc[0:1]])
-                            sig_reused_combined_df = pd.concat([sig_reused_combined_df, kem_df.iloc[1:2]])
+                        # Collect the first use and reused rows for the current run
+                        sig_first_run_dfs.append(kem_df.iloc[0:1])
+                        sig_reused_run_dfs.append(kem_df.iloc[1:2])
     
                         # Define the average rows
                         sig_first_average_row = [sig, kem, ""]
                         sig_reused_average_row = [sig, kem, "*"]
                     
+                    # Combine the collected run rows in a single step
+                    sig_first_combined_df = pd.concat(sig_first_run_dfs)
+                    sig_reused_combined_df = pd.concat(sig_reused_run_dfs)
+
                     # Remove any runs that contain an inf value for the current sig/kem combo
                     valid_sig_first_combined_df = sig_first_combined_df[~sig_first_combined_df.isin([np.inf, -np.inf]).any(axis=1)]
                     valid_sig_reused_combined_df = sig_reused_combined_df[~sig_reused_combined_df.isin([np.inf, -np.inf]).any(axis=1)]
@@ -368,31 +387,31 @@ class TLSAverager:
             # Loop through all ECC curves
             for alg in self.algs_dict['classic_algs']:
 
-                # Resetting the combined curve dataframe
-                curve_first_combined_df = pd.DataFrame(columns=self.col_headers['classic_headers'])
-                curve_reused_combined_df = pd.DataFrame(columns=self.col_headers['classic_headers'])
+                # Resetting the lists used to collect the per-run rows for the current curve
+                curve_first_run_dfs = []
+                curve_reused_run_dfs = []
 
                 # Looping through all the runs
                 for current_run in range(1, self.num_runs+1):
 
                     # Setting current run filepath
-                    current_run_filename = f"classic_results_run_{str(current_run)}.csv"
+                    current_run_filename = f"classic_results_run_{current_run}.csv"
                     current_run_filepath = os.path.join(self.dir_paths['classic_handshake_results'], current_run_filename)
 
                     # Reading in the current run CSV to get metrics
-                    current_run_df = pd.read_csv(current_run_filepath)
+                    current_run_df = self.read_results_file(current_run_filepath)
 
                     # Extracting the data for the current curve and ciphersuite
-                    cipher_df = current_run_df[current_run_df["Ciphersuite"].str.contains(cipher, regex=False)]
-                    curve_df = cipher_df[cipher_df["Classic Algorithm"].str.contains(alg, regex=False)]
+                    cipher_df = current_run_df[current_run_df["Ciphersuite"] == cipher]
+                    curve_df = cipher_df[cipher_df["Classic Algorithm"] == alg]
 
-                    # Separating the data into combined dataframes
-                    if current_run == 1:
-                        curve_first_combined_df = curve_df.iloc[0:1]
-                        curve_reused_combined_df = curve_df.iloc[1:2]
-                    else:
-                        curve_first_combined_df = pd.concat([curve_first_combined_df, curve_df.iloc[0:1]])
-                        curve_reused_combined_df = pd.concat([curve_reused_combined_df, curve_df.iloc[1:2]])
+                    # Collecting the first use and reused rows for the current run
+                    curve_first_run_dfs.append(curve_df.iloc[0:1])
+                    curve_reused_run_dfs.append(curve_df.iloc[1:2])
+
+                # Combining the collected run rows in a single step
+                curve_first_combined_df = pd.concat(curve_first_run_dfs)
+                curve_reused_combined_df = pd.concat(curve_reused_run_dfs)
 
                 # Calculating Averages
                 curve_first_combined_row = [cipher, alg, ""]
@@ -423,7 +442,7 @@ class TLSAverager:
         temp_alg_filepath = os.path.join(dir_list[1], temp_filename)
 
         # Getting algorithms present in the current speed file
-        temp_alg_df = pd.read_csv(temp_alg_filepath)
+        temp_alg_df = self.read_results_file(temp_alg_filepath)
         algs = temp_alg_df["Algorithm"].to_list()
 
         return algs
@@ -454,28 +473,29 @@ class TLSAverager:
                 headers = speed_headers[0] if alg_type == "kem" else speed_headers[1]
                 speed_avg_df = pd.DataFrame(columns=headers)
 
+                # Read in the parsed speed results for each run once, so they are not re-parsed for every algorithm
+                speed_run_dfs = []
+                for run_num in range(1, self.num_runs+1):
+                    current_filename = f"{pqc_fileprefix}_{alg_type}_{run_num}.csv"
+                    speed_run_dfs.append(self.read_results_file(os.path.join(dir_list[1], current_filename)))
+
                 # Loop through the algs to get combined average dataframes
                 for alg in algs:
 
-                    # Set the clean combined alg speed dataframe
-                    combined_df = pd.DataFrame(columns=headers)
+                    # Set the list used to collect the alg rows for each run
+                    run_dfs = []
 
                     # Loop through the runs to get averages for the alg type
-                    for run_num in range(1, self.num_runs+1):
-
-                        # Set the filename and path for the current type and run
-                        current_filename = f"{pqc_fileprefix}_{alg_type}_{run_num}.csv"
-                        current_filepath = os.path.join(dir_list[1], current_filename)
+                    for run_num, speed_run_df in enumerate(speed_run_dfs, start=1):
                     
                         # Pull in the algorithm values for the current run and alg
-                        current_run_df = pd.read_csv(current_filepath)
-                        current_run_df = current_run_df[current_run_df["Algorithm"].str.contains(alg, regex=False)]
+                        current_run_df = speed_run_df[speed_run_df["Algorithm"] == alg]
 
-                        # Add  algorithm values to the combined dataframe that will be used to get averages for the alg across runs
-                        if run_num == 1:
-                            combined_df = current_run_df.loc[current_run_df['Algorithm'].str.contains(alg, regex=False)]
-                        else:
-                            combined_df = pd.concat([combined_df, current_run_df.iloc[0:1]])
+                        # Collect the algorithm values that will be used to get averages for the alg across runs
+                        run_dfs.append(current_run_df if run_num == 1 else current_run_df.iloc[0:1])
+
+                    # Combine the collected run rows in a single step
+                    combined_df = pd.concat(run_dfs)
 
                     # Get the average value for each column and append to new row var
                     speed_avg_row = []
@@ -10,12 +10,128 @@ Supports setups using both OpenSSL-native PQC algorithms and the OQS-Provider.
 
 #------------------------------------------------------------------------------------------------------------------------------
 import pandas as pd
+import numpy as np
+import csv
+import io
 import os
+import re
 import sys
 import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import product
 from internal_scripts.results_averager import TLSAverager
 
+# Use PyArrow for writing the CSV, Parquet and Feather output files if it is available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import feather as pafeather
+    from pyarrow import parquet as pq
+except ImportError:
+    pa = None
+    pacsv = None
+    pafeather = None
+    pq = None
+
+# Determine if the PyArrow CSV writer should be used, allowing it to be disabled via the environment
+USE_PYARROW_CSV = pacsv is not None and os.environ.get("PQC_LEO_PYARROW_CSV", "1") != "0"
+
+# Set the format used for the typed copies of the parsed results, with Feather able to be selected via the environment
+INTERMEDIATE_FORMAT = "feather" if os.environ.get("PQC_LEO_INTERMEDIATE_FORMAT", "parquet").lower() == "feather" else "parquet"
+
+#------------------------------------------------------------------------------------------------------------------------------
+# Placeholder metrics used for the rows of missing s_time output files
+MISSING_METRICS = ("",) * 5
+
+# Compiled patterns for the s_time user time and real time metrics lines
+USER_METRICS_RE = re.compile(rb"^\s*(\d+)\s+connections\s+in\s+([\d.]+)s;\s+(\S+)\s+connections/user", re.M)
+REAL_METRICS_RE = re.compile(rb"^\s*(\d+)\s+connections\s+in\s+(\d+)\s+real", re.M)
+
+# Number of threads used to read the s_time output files for a single run, as the reads are I/O bound
+METRIC_THREAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+#------------------------------------------------------------------------------------------------------------------------------
+@dataclass
+class ParseContext:
+    """ Class for holding the parsing state shared by the TLS processing functions. A single instance is created per 
+        parse and passed to each function (and worker process) instead of threading the individual dictionaries through. """
+
+    dir_paths: dict
+    algs_dict: dict
+    pqc_type_vars: dict
+    col_headers: dict
+    speed_headers: list
+    num_runs: int
+    write_parquet: bool = True
+
+#------------------------------------------------------------------------------------------------------------------------------
+def get_typed_df(output_df):
+    """ Helper function for converting the string columns of a parsed results dataframe into the same types that 
+        pandas would infer when reading the CSV file, with empty values set as missing and numeric columns converted. """
+
+    # Convert each column to numeric if all of its present values are numbers, otherwise keep it as strings
+    typed_columns = {}
+    for column in output_df.columns:
+        column_values = output_df[column].mask(output_df[column] == "")
+        try:
+            typed_columns[column] = pd.to_numeric(column_values)
+        except (ValueError, TypeError):
+            typed_columns[column] = column_values
+
+    return pd.DataFrame(typed_columns)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def write_csv_output(output_rows, headers, output_filepath, write_parquet=False):
+    """ Helper function for writing the parsed results rows to a CSV file. The PyArrow CSV writer is used when 
+        available, otherwise the rows are written directly with the standard library CSV writer. Both produce the same 
+        unquoted, index-free output, which is formatted in memory and written to the file in a single call. If requested 
+        and PyArrow is available, a typed Parquet (or uncompressed Feather) copy is also written alongside for faster 
+        reading by the averager. A dataframe is only created for the rows when PyArrow is used. """
+
+    # Set the variable used to hold the formatted CSV contents
+    csv_contents = None
+
+    # Create the dataframe needed by the PyArrow writers, skipping it entirely if PyArrow will not be used
+    output_df = pd.DataFrame(output_rows, columns=headers) if USE_PYARROW_CSV or (write_parquet and pa is not None) else None
+
+    # Format the CSV using PyArrow if available, falling back to the standard CSV writer if a value would require quoting
+    if USE_PYARROW_CSV:
+        try:
+            output_table = pa.Table.from_pandas(output_df, preserve_index=False)
+
+            # Write the header separately as PyArrow always quotes the column names
+            csv_buffer = io.BytesIO()
+            csv_buffer.write((",".join(headers) + "\n").encode())
+            pacsv.write_csv(output_table, csv_buffer, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+            csv_contents = csv_buffer.getvalue()
+
+        except pa.ArrowInvalid:
+            pass
+
+    # Format the header and rows directly as the output tables are small and already hold their final string values
+    if csv_contents is None:
+        csv_buffer = io.StringIO()
+        csv_writer = csv.writer(csv_buffer, lineterminator="\n")
+        csv_writer.writerow(headers)
+        csv_writer.writerows(output_rows)
+        csv_contents = csv_buffer.getvalue().encode()
+
+    # Write the formatted CSV contents to the output file in a single call
+    with open(output_filepath, "wb") as output_file:
+        output_file.write(csv_contents)
+
+    # Write the typed copy of the results with the column types used by the averager in the selected format
+    if write_parquet and pa is not None:
+        typed_table = pa.Table.from_pandas(get_typed_df(output_df), preserve_index=False)
+        output_basepath = os.path.splitext(output_filepath)[0]
+
+        if INTERMEDIATE_FORMAT == "feather":
+            pafeather.write_feather(typed_table, output_basepath + ".feather", compression="uncompressed")
+        else:
+            pq.write_table(typed_table, output_basepath + ".parquet", compression="zstd")
+
 #------------------------------------------------------------------------------------------------------------------------------
 def setup_parse_env(root_dir):
     """ Function for setting up the environment for parsing PQC TLS results. Sets directory paths, reads algorithm lists, 
@@ -62,7 +178,8 @@ def setup_parse_env(root_dir):
         "up_results_path": "",
         "results_type": ["pqc_handshake_results", "hybrid_handshake_results"],
         "type_prefix": ["pqc", "hybrid"],
-        "base_type": ["pqc_base_results", "hybrid_base_results"]
+        "base_type": ["pqc_base_results", "hybrid_base_results"],
+        "alg_pairs": []
     }
 
     # Declare the dictionary which contains testing types and define the speed column headers
@@ -88,39 +205,90 @@ def setup_parse_env(root_dir):
         "hybrid_speed_sig_algs": os.path.join(root_dir, "test_data", "alg_lists", "tls_speed_hybr_sig_algs.txt"),
     }
 
-    # Pull the algorithm names from the alg-lists files and create the relevant alg lists
+    # Pull the algorithm names from the alg-lists files and create the relevant alg lists, interning the names so that 
+    # algorithms shared between lists use a single string object throughout the parsed rows
     for alg_type, filepath in alg_list_files.items():
         with open(filepath, "r") as alg_file:
-            for line in alg_file:
-                algs_dict[alg_type].append(line.strip())
+            algs_dict[alg_type] = [sys.intern(alg) for alg in alg_file.read().split()]
 
-    # Empty the alg_list_files dict as no longer needed
-    alg_list_files = None
+    # Precompute the sig/kem combination lists for the PQC and PQC-Hybrid test types so they are not rebuilt every run
+    for sig_alg_type, kem_alg_type in zip(pqc_type_vars["sig_alg_type"], pqc_type_vars["kem_alg_type"]):
+        pqc_type_vars["alg_pairs"].append([(sig, kem) for sig in algs_dict[sig_alg_type] for kem in algs_dict[kem_alg_type]])
 
     return dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers
 
 #------------------------------------------------------------------------------------------------------------------------------
-def handle_results_dir_creation(machine_id, dir_paths, replace_old_results):
+def create_results_dirs(dir_paths):
+    """ Helper function for creating the handshake and speed parsed results directories for the current Machine-ID. 
+        Existing directories are tolerated so that creation cannot fail on a directory which is already present. """
+
+    # Create the parsed results directories for the current machine
+    for results_dir in (dir_paths["mach_handshake_dir"], dir_paths["mach_speed_results_dir"]):
+        os.makedirs(results_dir, exist_ok=True)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def wait_for_results_move(machine_id, dir_paths):
+    """ Helper function for halting the parsing until the old parsed results for the current Machine-ID have been 
+        moved. The results directory is polled rather than waiting on user input so that scripted runs are not blocked. """
+
+    # Output the halting message and poll until the old results directory is no longer present
+    print(f"Halting parsing script until the old parsed results for Machine-ID ({machine_id}) have been moved from:")
+    print(f"{dir_paths['mach_results_dir']}\n")
+
+    while os.path.exists(dir_paths["mach_results_dir"]):
+        time.sleep(2)
+
+    # Create the new directories for parsed results now the old results have been moved
+    print("Old results have been moved, now continuing with parsing script")
+    create_results_dirs(dir_paths)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def handle_results_dir_creation(machine_id, dir_paths, replace_old_results, on_existing=None):
     """ Function for handling the presence of older parsed results, ensuring that the user
-        is aware of the old results and can choose how to handle them before the parsing continues. """
+        is aware of the old results and can choose how to handle them before the parsing continues. If an 
+        on-existing policy has been passed, it is applied without prompting the user. If no policy has been passed 
+        and stdin is not a terminal, the parsing is stopped rather than blocking on a prompt that cannot be answered. """
 
     # Check if there are any old parsed results for the current Machine-ID and handle any clashes
     if os.path.exists(dir_paths["mach_results_dir"]):
 
-        # Determine if the user needs prompted to handle the old results or if the --replace-old-results flag is set
-        if replace_old_results:
+        # Determine if the user needs prompted to handle the old results or if a non-interactive policy is set
+        if replace_old_results or on_existing == "replace":
 
             # Output the warning message about the old results
-            print(f"[NOTICE] - The --replace-old-results flag has been set, replacing the old results for Machine-ID ({machine_id})\n")
-            time.sleep(2)
+            print(f"[NOTICE] - Replacing old results has been requested, replacing the old results for Machine-ID ({machine_id})\n")
 
             # Replace all old results and create a new empty directory to store the parsed results
             print(f"Removing old results directory for Machine-ID ({machine_id}) before continuing...\n")
-            shutil.rmtree(dir_paths["results_dir"], f"machine_{machine_id}")
+            shutil.rmtree(dir_paths["mach_results_dir"])
 
             # Create the new directories for parsed results
-            os.makedirs(dir_paths["mach_handshake_dir"])
-            os.makedirs(dir_paths["mach_speed_results_dir"])
+            create_results_dirs(dir_paths)
+
+        elif on_existing == "abort":
+
+            # Exit the script so the old results are left untouched
+            print(f"[ERROR] - Parsed TLS performance results already exist for Machine-ID ({machine_id}) and --on-existing is set to abort")
+            sys.exit(1)
+
+        elif on_existing == "wait":
+
+            # Wait until the old results have been moved before continuing
+            print(f"[NOTICE] - Parsed TLS performance results already exist for Machine-ID ({machine_id}) and --on-existing is set to wait\n")
+            wait_for_results_move(machine_id, dir_paths)
+
+        elif on_existing == "keep":
+
+            # Keep the old results and ensure the parsed results directories are present before continuing
+            print(f"[NOTICE] - Keeping old parsed results for Machine-ID ({machine_id}) as --on-existing is set to keep\n")
+            create_results_dirs(dir_paths)
+
+        elif not sys.stdin.isatty():
+
+            # Exit the script as the user cannot be prompted when running non-interactively
+            print(f"[ERROR] - Parsed TLS performance results already exist for Machine-ID ({machine_id}) and the script is not running interactively")
+            print("Please use the --on-existing or --replace-old-results flags to choose how the existing results should be handled")
+            sys.exit(1)
         
         else:
 
@@ -135,17 +303,17 @@ def handle_results_dir_creation(machine_id, dir_paths, replace_old_results):
                 print("Option 1 - Replace old parsed results with new ones")
                 print("Option 2 - Exit parsing programme to move old results and rerun after (if you choose this option, please move the entire folder not just its contents)")
                 print("Option 3 - Make parsing script programme wait until you have move files before continuing")
+                print("Option 4 - Keep old parsed results and only parse the runs which have not already been parsed")
                 user_choice = input("Enter option: ")
 
                 if user_choice == "1":
 
                     # Replace all old results and create a new empty directory to store the parsed results
                     print(f"Removing old results directory for Machine-ID ({machine_id}) before continuing...\n")
-                    shutil.rmtree(dir_paths["results_dir"], f"machine_{machine_id}")
+                    shutil.rmtree(dir_paths["mach_results_dir"])
 
                     # Create the new directories for parsed results
-                    os.makedirs(dir_paths["mach_handshake_dir"])
-                    os.makedirs(dir_paths["mach_speed_results_dir"])
+                    create_results_dirs(dir_paths)
                     break
 
                 elif user_choice == "2":
@@ -157,301 +325,300 @@ def handle_results_dir_creation(machine_id, dir_paths, replace_old_results):
                 elif user_choice == "3":
 
                     # Halting script until old results have been moved for the current Machine-ID
-                    while True:
-
-                        input(f"Halting parsing script so old parsed results for Machine-ID ({machine_id}) can be moved, press enter to continue")
+                    wait_for_results_move(machine_id, dir_paths)
+                    break
 
-                        # Checking if old results have been moved before continuing
-                        if os.path.exists(dir_paths["mach_results_dir"]):
-                            print(f"Old parsed results for Machine-ID ({machine_id}) still present!!!\n")
+                elif user_choice == "4":
 
-                        else:
-                            print("Old results have been moved, now continuing with parsing script")
-                            os.makedirs(dir_paths["mach_handshake_dir"])
-                            os.makedirs(dir_paths["mach_speed_results_dir"])
-                            break
-                    
+                    # Keep the old results and ensure the parsed results directories are present before continuing
+                    print(f"Keeping old parsed results for Machine-ID ({machine_id}) before continuing...\n")
+                    create_results_dirs(dir_paths)
                     break
 
                 else:
                     
                     # Output the warning message if the user input is not valid
-                    print("Incorrect value, please select (1/2/3)")
+                    print("Incorrect value, please select (1/2/3/4)")
 
     else:
         
         # No old parsed results for current machine-id present, so creating new dirs
-        os.makedirs(dir_paths["mach_handshake_dir"])
-        os.makedirs(dir_paths["mach_speed_results_dir"])
+        create_results_dirs(dir_paths)
 
 #------------------------------------------------------------------------------------------------------------------------------
-def get_metrics(current_row, test_filepath, get_reuse_metrics):
-    """ Helper function to extract signature/KEM handshake metrics from s_time output files, 
-        handling both session ID first use and reuse metrics. """
+def get_section_metrics(section):
+    """ Helper function to extract the five handshake metrics from a single section of an s_time output file, 
+        matching the user time and real time metrics lines with the precompiled patterns. """
+
+    # Match the user time and real time metrics lines in the section
+    user_match = USER_METRICS_RE.search(section)
+    real_match = REAL_METRICS_RE.search(section)
+
+    # Collect the matched metrics, decoding only the returned tokens
+    metrics = []
+
+    if user_match:
+        metrics.extend(token.decode("ascii") for token in user_match.groups())
+
+    if real_match:
+        metrics.extend(token.decode("ascii") for token in real_match.groups())
+
+    return tuple(metrics)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def get_first_use_metrics(data):
+    """ Helper function to extract the session ID first use metrics from the contents of an s_time output file, 
+        using only the section of the file before the session ID reuse marker. """
+
+    # Use the whole file if the reuse marker is not present, otherwise only the section before it
+    reuse_index = data.find(b"reuse")
+    return get_section_metrics(data if reuse_index == -1 else data[:reuse_index])
+
+#------------------------------------------------------------------------------------------------------------------------------
+def get_reuse_metrics(data):
+    """ Helper function to extract the session ID reuse metrics from the contents of an s_time output file, 
+        using only the section of the file after the session ID reuse marker line. """
+
+    # Return no metrics if the reuse marker is not present, otherwise use the section after the marker line
+    reuse_index = data.find(b"reuse")
+    if reuse_index == -1:
+        return get_section_metrics(b"")
+
+    line_end = data.find(b"\n", reuse_index)
+    return get_section_metrics(data[line_end + 1:] if line_end != -1 else b"")
+
+#------------------------------------------------------------------------------------------------------------------------------
+def parse_stime_file(test_filepath):
+    """ Helper function to extract the signature/KEM handshake metrics from an s_time output file. The file is read 
+        once as bytes and passed to the first use and reuse metrics functions, with both returned together as two tuples 
+        so each file is only opened and read a single time. """
 
     # Get the relevant data from the supplied performance metrics output file
     try:
 
-        # Open the file and extract the metrics
-        with open(test_filepath, "r") as test_file:
+        # Read the raw file contents without decoding them
+        with open(test_filepath, "rb") as test_file:
+            data = test_file.read()
 
-            # Set flag used to determine metric type (first use or session id reused)
-            session_metrics_flag = False
+    except FileNotFoundError:
 
-            # Loop through the file lines to pull the performance metrics
-            for line in test_file:
+        # Output the file not found error and the missing filename
+        print(f"missing file - {test_filepath}")
 
-                # Check the line to see if metrics are for the session ID's first use or reuse
-                if "reuse" in line:
-                    session_metrics_flag = True
+        # Return empty metrics as a placeholder for a missing file
+        return MISSING_METRICS, MISSING_METRICS
 
-                # Get line 1 metrics using keywords
-                if "connections" in line and "user" in line:
+    except OSError as error:
 
-                    # Check if metrics is session first use or reuse
-                    if session_metrics_flag is False and get_reuse_metrics is False:
+        # Output the read error and exit as the file is present but cannot be read
+        print(f"[ERROR] - Unable to read the s_time output file {test_filepath} - {error.strerror}")
+        sys.exit(1)
 
-                        # Store line 1 first use metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3][:-2])
-                        current_row.append(separated_line[4])
+    return get_first_use_metrics(data), get_reuse_metrics(data)
 
-                    elif session_metrics_flag is True and get_reuse_metrics is True:
+#------------------------------------------------------------------------------------------------------------------------------
+def get_run_metric_rows(name_pairs, filename_prefix, filepath_prefix, up_files):
+    """ Helper function to collect the first use and reuse metric rows for each algorithm combination in the current run. 
+        The present s_time files are read concurrently using a thread pool and the rows are filled into an array of the 
+        known final shape in the original combination order, with placeholder rows added for any files which are missing. """
 
-                        # Store line 1 session id reuse metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3][:-2])
-                        current_row.append(separated_line[4])
-                
-                # Get line 2 metrics using keywords
-                elif "connections" in line and "real" in line:
+    # Determine which of the combination files are present, outputting the missing files in order
+    present_flags = []
+    present_filepaths = []
 
-                    # Check if metrics are first use or reuse
-                    if session_metrics_flag is False and get_reuse_metrics is False:
+    for first_name, second_name in name_pairs:
 
-                        # Store line 2 first use metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3])
-                        break
+        # Set the filepath using the supplied prefixes and check it against the directory listing
+        test_filepath = f"{filepath_prefix}{first_name}_{second_name}.txt"
 
-                    elif session_metrics_flag is True and get_reuse_metrics is True:
+        if f"{filename_prefix}{first_name}_{second_name}.txt" in up_files:
+            present_flags.append(True)
+            present_filepaths.append(test_filepath)
+        else:
+            print(f"missing file - {test_filepath}")
+            present_flags.append(False)
 
-                        # Store line 2 session id reuse metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3])
+    # Read the present files concurrently, with the results being returned in submission order
+    with ThreadPoolExecutor(max_workers=METRIC_THREAD_WORKERS) as executor:
+        metric_pairs = executor.map(parse_stime_file, present_filepaths)
 
-    except:
+    # Preallocate the rows array as there are exactly two rows (first use and reuse) for each combination
+    metric_rows = np.empty((2 * len(name_pairs), 3 + len(MISSING_METRICS)), dtype=object)
 
-        # Output the file not found error and the missing filename
-        print(f"missing file - {test_filepath}")
+    # Fill the first use and reuse rows for each combination, using placeholder metrics for missing files
+    for pair_index, ((first_name, second_name), is_present) in enumerate(zip(name_pairs, present_flags)):
+        first_metrics, reused_metrics = next(metric_pairs) if is_present else (MISSING_METRICS, MISSING_METRICS)
+        row_index = 2 * pair_index
 
-        # Create an empty row as a placeholder for a missing file
-        for _ in range(1,6):
-            current_row.append("")
+        metric_rows[row_index, :3] = (first_name, second_name, "")
+        metric_rows[row_index, 3:3 + len(first_metrics)] = first_metrics
+        metric_rows[row_index + 1, :3] = (first_name, second_name, "*")
+        metric_rows[row_index + 1, 3:3 + len(reused_metrics)] = reused_metrics
 
-    return current_row
+    return metric_rows
 
 #------------------------------------------------------------------------------------------------------------------------------
-def pqc_based_pre_processing(current_run, type_index, pqc_type_vars, col_headers, algs_dict, dir_paths):
+def pqc_based_pre_processing(ctx, current_run, type_index):
     """ Function for pre-processing PQC and PQC-Hybrid TLS results for the current run. This function
         will loop through the sig/kem combinations and extract the metrics for each combination. This creates the 
-        full base results for the current run which can later be separated into individual CSV files for each sig/kem combo """
+        full base results for the current run, with the rows for each signature also collected so that the individual 
+        CSV files for each sig/kem combo can be created directly without re-reading or filtering the base results """
     
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    pqc_type_vars = ctx.pqc_type_vars
+    col_headers = ctx.col_headers
+
+    # Get the precomputed sig/kem combinations and the up-results directory for the current test type
+    alg_pairs = pqc_type_vars["alg_pairs"][type_index]
+    up_results_dir = pqc_type_vars["up_results_path"][type_index]
+
+    # List the up-results directory once so missing files can be handled without attempting to open them
+    up_files = {entry.name for entry in os.scandir(up_results_dir)} if os.path.isdir(up_results_dir) else set()
+
     # Check if the stored up-results match the number of algorithms in the alg list files, only if run 1
     if current_run == 1:
 
-        # Determine the number of expected and actual result files in the up-results directory
-        up_results_dir = pqc_type_vars["up_results_path"][type_index]
-        expected_files = len(algs_dict[pqc_type_vars["sig_alg_type"][type_index]]) * len(algs_dict[pqc_type_vars["kem_alg_type"][type_index]])
-        actual_files = [file for file in os.listdir(up_results_dir) if file.startswith("tls_handshake_1_") and file.endswith(".txt")]
+        # Determine the expected and actual result filenames for the first run in the up-results directory
+        expected_files = {f"tls_handshake_1_{sig}_{kem}.txt" for sig, kem in alg_pairs}
+        actual_files = {file for file in up_files if file.startswith("tls_handshake_1_") and file.endswith(".txt")}
 
-        # Ensure that the up-results directory for the current PQC type and run contains the correct number of files
-        if expected_files != len(actual_files):
-            print(f"\n[ERROR] - Mismatch in expected file count for {pqc_type_vars['type_prefix'][type_index].upper()} TLS Handshake results.")
-            print(f"Please ensure the alg-list files have the same algorithms used in the testing, the setup process may need to be re-run")
-            print(f"If that is the case, please ensure to copy the up-results directory to a safe location before re-running the setup script")
-            sys.exit(1)
+        # Ensure that the up-results directory for the current PQC type and run contains exactly the expected files
+        missing_files = sorted(expected_files - actual_files)
+        unexpected_files = sorted(actual_files - expected_files)
 
-    # Declare the dataframe used in pre-processing
-    sig_metrics_df = pd.DataFrame(columns=col_headers['pqc_based_headers'])
+        if missing_files or unexpected_files:
+            print(f"\n[ERROR] - Mismatch in expected files for {pqc_type_vars['type_prefix'][type_index].upper()} TLS Handshake results.")
 
-    # Loop through the sig list to create the CSV
-    for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+            # Output the first few missing and unexpected filenames to help pinpoint the mismatch
+            if missing_files:
+                print(f"Missing files ({len(missing_files)}): {', '.join(missing_files[:5])}{' ...' if len(missing_files) > 5 else ''}")
+            if unexpected_files:
+                print(f"Unexpected files ({len(unexpected_files)}): {', '.join(unexpected_files[:5])}{' ...' if len(unexpected_files) > 5 else ''}")
 
-        # Loop through the KEM files signed with the current sig
-        for kem in algs_dict[pqc_type_vars["kem_alg_type"][type_index]]:
-
-            # Set the filename and path
-            filename = f"tls_handshake_{current_run}_{sig}_{kem}.txt"
-            test_filepath = os.path.join(pqc_type_vars["up_results_path"][type_index], filename)
-            
-            # Get the session ID first, use metrics for the current KEM
-            current_row = [kem, ""]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=False)
-            current_row.insert(0, sig)
+            print(f"Please ensure the alg-list files have the same algorithms used in the testing, the setup process may need to be re-run")
+            print(f"If that is the case, please ensure to copy the up-results directory to a safe location before re-running the setup script")
+            sys.exit(1)
 
-            # Add the session id first use row to the dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['pqc_based_headers'])
-            sig_metrics_df = pd.concat([sig_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
+    # Precompute the filename and filepath prefixes for the current run
+    filename_prefix = f"tls_handshake_{current_run}_"
+    filepath_prefix = f"{up_results_dir}{os.sep}{filename_prefix}"
 
-            # Get the session id reused metrics for the current KEM
-            current_row = [kem, "*"]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=True)
-            current_row.insert(0, sig)
+    # Collect the first use and reuse metric rows for each sig/kem combination
+    metric_rows = get_run_metric_rows(alg_pairs, filename_prefix, filepath_prefix, up_files)
 
-            # Add the session id reused use row to the dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['pqc_based_headers'])
-            sig_metrics_df = pd.concat([sig_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
+    # Collect the rows for each signature in the alg-list order alongside the full base results rows
+    per_sig_rows = {sig: [] for sig in ctx.algs_dict[pqc_type_vars["sig_alg_type"][type_index]]}
+    for metric_row in metric_rows:
+        per_sig_rows[metric_row[0]].append(metric_row)
 
-    # Output the full base PQC TLS metrics for the current run
+    # Output the full base PQC TLS metrics for the current run directly from the collected rows
     base_out_filename = f"{pqc_type_vars['type_prefix'][type_index]}_base_results_run_{current_run}.csv"
     output_filepath = os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], base_out_filename)
-    sig_metrics_df.to_csv(output_filepath,index=False)
+    write_csv_output(metric_rows, col_headers['pqc_based_headers'], output_filepath, ctx.write_parquet)
+
+    return per_sig_rows
 
 #------------------------------------------------------------------------------------------------------------------------------
-def pqc_based_processing(current_run, dir_paths, algs_dict, pqc_type_vars, col_headers):
+def pqc_based_processing(ctx, current_run):
     """ Function to parse and process both PQC and PQC-Hybrid TLS results for the current run. 
         Generates base results and separates them into individual CSV files for each sig/KEM combo. """
 
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    pqc_type_vars = ctx.pqc_type_vars
+    pqc_based_headers = ctx.col_headers['pqc_based_headers']
+
     # Process the results for both PQC (0) and PQC-Hybrid (1) TLS results
     for type_index in range (0,2):
 
-        # Perform pre-processing for the current test type
-        pqc_based_pre_processing(current_run, type_index, pqc_type_vars, col_headers, algs_dict, dir_paths)
+        # Perform pre-processing for the current test type and keep the rows collected for each signature
+        per_sig_rows = pqc_based_pre_processing(ctx, current_run, type_index)
 
-        # Set the base results filename and path based on current run
-        pqc_base_filename = f"{pqc_type_vars['type_prefix'][type_index]}_base_results_run_{current_run}.csv"
-        pqc_base_filepath = os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], pqc_base_filename)
+        # Set the results directory path prefix for the current test type once before the signature loop
+        results_dir_prefix = f"{dir_paths[pqc_type_vars['results_type'][type_index]]}{os.sep}"
 
-        # Create the storage directory and files for separated sig/kem combo results
-        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+        # Create the storage directory and files for separated sig/kem combo results in the alg-list order
+        for sig, sig_rows in per_sig_rows.items():
 
-            # Set the path for the sig/kem combo directory
-            sig_path = os.path.join(dir_paths[pqc_type_vars["results_type"][type_index]], sig)
+            # Set the path for the sig/kem combo directory using the precomputed prefix
+            sig_path = f"{results_dir_prefix}{sig}"
 
-            # Create the storage dir for separated sig/kem combo results if not made
-            if not os.path.exists(sig_path):
-                os.makedirs(sig_path)
-            
-            # Read in the current run base results and extract signature
-            base_df = pd.read_csv(pqc_base_filepath)
-            current_sig_df = base_df[base_df["Signing Algorithm"].str.contains(sig)]
+            # Create the storage dir for separated sig/kem combo results if not made (tolerating runs processed in parallel)
+            os.makedirs(sig_path, exist_ok=True)
 
-            # Output the current sig filtered df to csv
-            output_filename = f"tls_handshake_{sig}_run_{current_run}.csv"
-            output_filepath = os.path.join(sig_path, output_filename)
-            current_sig_df.to_csv(output_filepath, index=False)
+            # Output the collected rows for the current sig to csv
+            output_filepath = f"{sig_path}{os.sep}tls_handshake_{sig}_run_{current_run}.csv"
+            write_csv_output(sig_rows, pqc_based_headers, output_filepath, ctx.write_parquet)
 
 #------------------------------------------------------------------------------------------------------------------------------
-def classic_based_processing(current_run, dir_paths, algs_dict, col_headers):
+def classic_based_processing(ctx, current_run):
     """ Function to process TLS handshake results for classic cipher algorithms, 
         extracting metrics and generating CSV files. """
 
-    # Set the up-results directory path and create the dataframe used in test processing
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    algs_dict = ctx.algs_dict
+    col_headers = ctx.col_headers
+
+    # Set the up-results filename and filepath prefixes for the current run
     classic_up_results_dir = os.path.join(dir_paths['mach_up_results_dir'], "handshake_results", "classic")
-    cipher_metrics_df = pd.DataFrame(columns=col_headers['classic_headers'])
-
-    # Loop through each ciphersuite
-    for cipher in algs_dict['ciphers']:
-
-        # Looping through each digital signature algorithm for the current ciphersuite
-        for alg in algs_dict['classic_algs']:
-
-            # Set the filename and path
-            filename = f"tls_handshake_classic_{current_run}_{cipher}_{alg}.txt"
-            test_filepath = os.path.join(classic_up_results_dir, filename)
-            
-            # Get the session ID first use metrics for the current signature
-            current_row = [alg, ""]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=False)
-            current_row.insert(0, cipher)
-
-            # Add the session ID first use row to the dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['classic_headers'])
-            cipher_metrics_df = pd.concat([cipher_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
-            
-            # Get the session ID reused metrics for the current signature
-            current_row = [alg, "*"]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=True)
-            current_row.insert(0, cipher)
-
-            # Add the session id reused use row to dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['classic_headers'])
-            cipher_metrics_df = pd.concat([cipher_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
-
-    # Output the full base Classic TLS metrics for current run
-    cipher_out_filename = f"classic_results_run_{current_run}.csv"
-    output_filepath = os.path.join(dir_paths['classic_handshake_results'], cipher_out_filename)
-    cipher_metrics_df.to_csv(output_filepath, index=False)
+    filename_prefix = f"tls_handshake_classic_{current_run}_"
+    filepath_prefix = f"{classic_up_results_dir}{os.sep}{filename_prefix}"
 
-#------------------------------------------------------------------------------------------------------------------------------
-def tls_speed_drop_last(data_cells):
-    """ Helper function for removing unwanted characters from 
-        metric values during the tls-speed results parsing """
+    # List the up-results directory once so missing files can be handled without attempting to open them
+    up_files = {entry.name for entry in os.scandir(classic_up_results_dir)} if os.path.isdir(classic_up_results_dir) else set()
 
-    # Loop through the values and remove any s chars present in metrics
-    for cell_index in range(1, len(data_cells)):
-        cell_value = data_cells[cell_index]
-        if "s" in cell_value:
-            data_cells[cell_index] = data_cells[cell_index].replace('s', '')
+    # Collect the first use and reuse metric rows for each ciphersuite and digital signature algorithm combination
+    metric_rows = get_run_metric_rows(list(product(algs_dict['ciphers'], algs_dict['classic_algs'])), filename_prefix, filepath_prefix, up_files)
 
-    return data_cells
+    # Output the full base Classic TLS metrics for current run directly from the collected rows
+    cipher_out_filename = f"classic_results_run_{current_run}.csv"
+    output_filepath = os.path.join(dir_paths['classic_handshake_results'], cipher_out_filename)
+    write_csv_output(metric_rows, col_headers['classic_headers'], output_filepath, ctx.write_parquet)
 
 #------------------------------------------------------------------------------------------------------------------------------
 def get_speed_metrics(speed_filepath, alg_type, speed_headers):
     """ Function to extract speed metrics from raw OpenSSL s_speed output for the specified 
-        algorithm type (KEM or SIG). """
+        algorithm type (KEM or SIG). The results table header is located by scanning the file lines 
+        and the table itself is then tokenised by the pandas C parser. """
 
-    # Declare the variables needed for getting metrics and setting up the dataframe with test/alg type headers
-    start = False
-    data_lists = []
+    # Set the test/alg type headers
     headers = speed_headers[0] if alg_type == "kem" else speed_headers[1]
-    speed_metrics_df = pd.DataFrame(columns=headers)
 
-    # Open the file and extract metrics
+    # Read in the file lines and find the results table header line
     with open(speed_filepath, "r") as speed_file:
-        for line in speed_file:
-
-            # Check to see if the result table has started
-            if "keygens/s" in line:
-                start = True
-                continue
-            elif "sign" in line and "verify" in line:
-                start = True
-                continue
-
-            # If the result table has started, extract data
-            if start:
-                data_lists.append(line.strip())
-    
-    # Append the data onto the dataframe
-    for data in data_lists:
+        file_lines = speed_file.read().splitlines()
+
+    table_lines = []
+    for line_index, line in enumerate(file_lines):
+        if "keygens/s" in line or ("sign" in line and "verify" in line):
+            table_lines = file_lines[line_index + 1:]
+            break
 
-        # Insert the alg name into the row
-        data_cells = data.split()
+    # Return an empty dataframe if the results table is not present in the file
+    if not any(line.strip() for line in table_lines):
+        return pd.DataFrame(columns=headers)
 
-        # Remove any s char present in speed metric values for the row
-        data_cells = tls_speed_drop_last(data_cells)
+    # Parse the results table rows that follow the header line as strings
+    speed_metrics_df = pd.read_csv(io.StringIO("\n".join(table_lines)), sep=r"\s+", header=None, names=headers, dtype=str, engine="c")
 
-        # Add the new data row to the speed metrics data frame
-        new_row_df = pd.DataFrame([data_cells], columns=headers)
-        speed_metrics_df = pd.concat([speed_metrics_df, new_row_df], ignore_index=True)
+    # Remove the trailing s chars present in the speed metric values
+    for column in headers[1:]:
+        speed_metrics_df[column] = speed_metrics_df[column].str.rstrip("s")
 
     return speed_metrics_df
 
 #------------------------------------------------------------------------------------------------------------------------------
-def speed_processing(current_run, dir_paths, speed_headers, algs_dict):
+def speed_processing(ctx, current_run):
     """ Function to process OpenSSL and OQS-Provider s_speed metrics for both 
         PQC and PQC-Hybrid algorithms in the current run. """
 
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    algs_dict = ctx.algs_dict
+    speed_headers = ctx.speed_headers
+
     # Define the alg type list 
     alg_types = ["kem", "sig"]
 
@@ -465,7 +632,7 @@ def speed_processing(current_run, dir_paths, speed_headers, algs_dict):
         for alg_type in alg_types:
 
             # Set the up-results filepath and pull metrics from the raw file
-            speed_filepath = os.path.join(dir_list[0], f"{pqc_fileprefix}_{alg_type}_{str(current_run)}.txt")
+            speed_filepath = os.path.join(dir_list[0], f"{pqc_fileprefix}_{alg_type}_{current_run}.txt")
             speed_metrics_df = get_speed_metrics(speed_filepath, alg_type, speed_headers)
 
             # Set the alg list dict key based on the current test and algorithm type
@@ -479,49 +646,146 @@ def speed_processing(current_run, dir_paths, speed_headers, algs_dict):
                 sys.exit(1)
 
             # Output the speed metrics CSV for the current test type and algorithm
-            output_filepath = os.path.join(dir_list[1], f"{pqc_fileprefix}_{alg_type}_{str(current_run)}.csv")
-            speed_metrics_df.to_csv(output_filepath, index=False)
+            output_filepath = os.path.join(dir_list[1], f"{pqc_fileprefix}_{alg_type}_{current_run}.csv")
+            write_csv_output(speed_metrics_df.to_numpy(), list(speed_metrics_df.columns), output_filepath, ctx.write_parquet)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def run_already_parsed(ctx, current_run):
+    """ Helper function for checking if all of the parsed output files for the current run are already present 
+        and non-empty, so that runs parsed by a previous invocation of the script can be skipped. """
+
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    algs_dict = ctx.algs_dict
+    pqc_type_vars = ctx.pqc_type_vars
+
+    # Set the base results and per-signature output filepaths for both PQC (0) and PQC-Hybrid (1) TLS results
+    output_filepaths = []
+    for type_index in range(0,2):
+        type_prefix = pqc_type_vars['type_prefix'][type_index]
+        output_filepaths.append(os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], f"{type_prefix}_base_results_run_{current_run}.csv"))
+
+        results_dir_prefix = f"{dir_paths[pqc_type_vars['results_type'][type_index]]}{os.sep}"
+        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+            output_filepaths.append(f"{results_dir_prefix}{sig}{os.sep}tls_handshake_{sig}_run_{current_run}.csv")
+
+    # Set the classic handshake and speed output filepaths
+    output_filepaths.append(os.path.join(dir_paths['classic_handshake_results'], f"classic_results_run_{current_run}.csv"))
+    for test_type, dir_list in dir_paths['speed_types_dirs'].items():
+        pqc_fileprefix = "tls_speed" if test_type == "pqc" else "tls_speed_hybrid"
+        for alg_type in ["kem", "sig"]:
+            output_filepaths.append(os.path.join(dir_list[1], f"{pqc_fileprefix}_{alg_type}_{current_run}.csv"))
+
+    # Determine if every output file for the run is present and contains data
+    return all(os.path.isfile(filepath) and os.path.getsize(filepath) > 0 for filepath in output_filepaths)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def process_run(ctx, current_run):
+    """ Function for processing the s_time and s_speed results for a single run. Each run reads and writes its own 
+        distinct files, so this is called in a separate worker process for each run. """
+
+    # Call the result processing functions for the current run
+    pqc_based_processing(ctx, current_run)
+    classic_based_processing(ctx, current_run)
+    speed_processing(ctx, current_run)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def output_processing(ctx, force):
+    """ Function to process the results of s_time and s_speed TLS benchmarking tests for the current machine. 
+        Runs which have already been fully parsed are skipped unless the force option is set. """
+
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+
+    # Set the base-results files directories for the different test types (these may exist if old results were kept)
+    os.makedirs(dir_paths['pqc_base_results'], exist_ok=True)
+    os.makedirs(dir_paths['classic_handshake_results'], exist_ok=True)
+    os.makedirs(dir_paths['hybrid_base_results'], exist_ok=True)
+
+    # Determine which runs need to be processed, skipping any that have already been parsed unless forced
+    runs_to_process = []
+    skipped_runs = []
+    for current_run in range(1, ctx.num_runs+1):
+        if not force and run_already_parsed(ctx, current_run):
+            skipped_runs.append(current_run)
+        else:
+            runs_to_process.append(current_run)
+
+    # Output the list of skipped runs if there are any
+    if skipped_runs:
+        print(f"[NOTICE] - Skipping already parsed runs {skipped_runs}, use the --force flag to re-parse them\n")
+
+    # Return early if there are no runs left to process
+    if not runs_to_process:
+        return
+
+    # Process the runs in parallel and wait for all to complete (averaging is done afterwards)
+    with ProcessPoolExecutor(max_workers=min(len(runs_to_process), os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(process_run, ctx, current_run)
+            for current_run in runs_to_process
+        ]
+
+        # Raise the first worker error as soon as it occurs, cancelling any runs which have not yet started
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except BaseException:
+                for pending_future in futures:
+                    pending_future.cancel()
+                raise
 
 #------------------------------------------------------------------------------------------------------------------------------
-def output_processing(num_runs, dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers):
-    """ Function to process the results of s_time and s_speed TLS benchmarking tests for the current machine. """
-
-    # Set the result directories paths in the central paths dictionary
-    dir_paths['pqc_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "pqc")
-    dir_paths['classic_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "classic")
-    dir_paths['hybrid_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "hybrid")
-    dir_paths['pqc_base_results'] = os.path.join(dir_paths['pqc_handshake_results'], "base_results")
-    dir_paths['hybrid_base_results'] = os.path.join(dir_paths['hybrid_handshake_results'], "base_results")
-
-    # Set the base-results files directories for the different test types
-    os.makedirs(dir_paths['pqc_base_results'])
-    os.makedirs(dir_paths['classic_handshake_results'])
-    os.makedirs(dir_paths['hybrid_base_results'])
-
-    # Loop through the runs and call result processing functions
-    for current_run in range(1, num_runs+1):
-        pqc_based_processing(current_run, dir_paths, algs_dict, pqc_type_vars, col_headers)
-        classic_based_processing(current_run, dir_paths, algs_dict, col_headers)
-        speed_processing(current_run, dir_paths, speed_headers, algs_dict)
+def build_machine_paths(machine_id, results_dir, up_results):
+    """ Helper function for building all of the results and up-results directory paths for the given Machine-ID. 
+        The paths are returned as a new dictionary so they can be merged into the central paths dictionary in one step. """
+
+    # Set the machine's base results and up-results directories
+    mach_dirname = f"machine_{machine_id}"
+    mach_results_dir = os.path.join(results_dir, mach_dirname)
+    mach_up_results_dir = os.path.join(up_results, mach_dirname)
+    mach_handshake_dir = os.path.join(mach_results_dir, "handshake_results")
+    mach_up_speed_dir = os.path.join(mach_up_results_dir, "speed_results")
+    mach_speed_results_dir = os.path.join(mach_results_dir, "speed_results")
+
+    # Set the handshake results directories for the different test types
+    pqc_handshake_results = os.path.join(mach_handshake_dir, "pqc")
+    hybrid_handshake_results = os.path.join(mach_handshake_dir, "hybrid")
+
+    # Create the machine paths dictionary
+    machine_paths = {
+        'mach_results_dir': mach_results_dir,
+        'mach_up_results_dir': mach_up_results_dir,
+        'mach_handshake_dir': mach_handshake_dir,
+        'mach_up_speed_dir': mach_up_speed_dir,
+        'mach_speed_results_dir': mach_speed_results_dir,
+        'speed_types_dirs': {
+            "pqc": [os.path.join(mach_up_speed_dir, "pqc"), mach_speed_results_dir], 
+            "hybrid": [os.path.join(mach_up_speed_dir, "hybrid"), mach_speed_results_dir],
+        },
+        'pqc_handshake_results': pqc_handshake_results,
+        'classic_handshake_results': os.path.join(mach_handshake_dir, "classic"),
+        'hybrid_handshake_results': hybrid_handshake_results,
+        'pqc_base_results': os.path.join(pqc_handshake_results, "base_results"),
+        'hybrid_base_results': os.path.join(hybrid_handshake_results, "base_results"),
+    }
+
+    return machine_paths
 
 #------------------------------------------------------------------------------------------------------------------------------
-def process_tests(machine_id, num_runs, dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers, replace_old_results):
+def process_tests(ctx, machine_id, replace_old_results, force, on_existing=None):
     """ Function for controlling the parsing scripts for the PQC TLS performance testing up-result files
         and calling average calculation scripts """
 
+    # Bind the required parsing context values to locals
+    dir_paths = ctx.dir_paths
+    pqc_type_vars = ctx.pqc_type_vars
+
     # Create an instance of the TLS average generator class before processing results
-    tls_avg = TLSAverager(dir_paths, num_runs, algs_dict, pqc_type_vars, col_headers)
+    tls_avg = TLSAverager(dir_paths, ctx.num_runs, ctx.algs_dict, pqc_type_vars, ctx.col_headers)
 
     # Set the machine's results directories paths in the central paths dictionary
-    dir_paths['mach_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine_{str(machine_id)}")
-    dir_paths['mach_up_results_dir'] = os.path.join(dir_paths['up_results'], f"machine_{str(machine_id)}")
-    dir_paths['mach_handshake_dir']  = os.path.join(dir_paths['results_dir'], f"machine_{str(machine_id)}", "handshake_results")
-    dir_paths['mach_up_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine_{str(machine_id)}", "speed_results")
-    dir_paths['mach_speed_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine_{str(machine_id)}", "speed_results")
-    dir_paths['speed_types_dirs'] = {
-        "pqc": [os.path.join(dir_paths['mach_up_speed_dir'], "pqc"), dir_paths['mach_speed_results_dir']], 
-        "hybrid": [os.path.join(dir_paths['mach_up_speed_dir'], "hybrid"), dir_paths['mach_speed_results_dir']],
-    }
+    dir_paths.update(build_machine_paths(machine_id, dir_paths['results_dir'], dir_paths['up_results']))
 
     # Set the pqc-var types dictionary so that both PQC and PQC-hybrid results can be processed
     pqc_type_vars.update({
@@ -537,16 +801,16 @@ def process_tests(machine_id, num_runs, dir_paths, algs_dict, pqc_type_vars, col
         sys.exit(1)
 
     # Create the results directory for the current machine and handle Machine-ID clashes
-    handle_results_dir_creation(machine_id, dir_paths, replace_old_results)
+    handle_results_dir_creation(machine_id, dir_paths, replace_old_results, on_existing)
 
     # Call the processing function and the average calculation methods for the current machine
-    output_processing(num_runs, dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers)
+    output_processing(ctx, force)
     tls_avg.gen_pqc_avgs()
     tls_avg.gen_classic_avgs()
-    tls_avg.gen_speed_avgs(speed_headers)
+    tls_avg.gen_speed_avgs(ctx.speed_headers)
 
 #------------------------------------------------------------------------------------------------------------------------------
-def parse_tls_performance(test_opts, replace_old_results):
+def parse_tls_performance(test_opts, replace_old_results, force=False, write_parquet=True, on_existing=None):
     """ Entrypoint function for parsing OQS-Provider TLS handshake and speed results. 
         Controls the parsing flow and triggers relevant functions. """
     
@@ -555,19 +819,11 @@ def parse_tls_performance(test_opts, replace_old_results):
     num_runs = test_opts[1]
     root_dir = test_opts[2]
 
-    # Setup script environment
+    # Setup script environment and create the parsing context shared by the processing functions
     print(f"\nPreparing to Parse TLS Performance Results:\n")
     dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers = setup_parse_env(root_dir)
+    ctx = ParseContext(dir_paths, algs_dict, pqc_type_vars, col_headers, speed_headers, num_runs, write_parquet)
 
     # Process the OQS-Provider results
     print(f"Parsing results...\n")
-    process_tests(
-        machine_id,
-        num_runs,
-        dir_paths,
-        algs_dict,
-        pqc_type_vars,
-        col_headers,
-        speed_headers,
-        replace_old_results
-    )
\ No newline at end of file
+    process_tests(ctx, machine_id, replace_old_results, force, on_existing)
\ No newline at end of file
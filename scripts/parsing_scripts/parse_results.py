@@ -11,88 +11,113 @@ of the original algorithm list files used for testing.
 """
 
 #------------------------------------------------------------------------------------------------------------------------------
-from internal_scripts.performance_data_parse import parse_comp_performance
-from internal_scripts.tls_performance_data_parse import parse_tls_performance
 import os
 import sys
 import argparse
+import importlib
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Set the number of parsers that can run at once when parsing both result sets, setting it to 1 forces sequential parsing
+PARSE_JOBS = int(os.environ.get("PQC_LEO_PARSE_JOBS", "2"))
+
+# Set the module and function for each parser, which are only imported once the parsing mode is known
+PARSER_MODULES = {
+    "computational": ("internal_scripts.performance_data_parse", "parse_comp_performance"),
+    "tls": ("internal_scripts.tls_performance_data_parse", "parse_tls_performance"),
+}
+LOADED_PARSERS = {}
 
 #------------------------------------------------------------------------------------------------------------------------------
-def handle_args():
-    """ Function for handling command-line arguments for the script, validates them, and returns the parsed arguments. 
-        Raises errors and exits if arguments are invalid. """
-    
-    # Define the argument parser and the valid options for the script
-    parser = argparse.ArgumentParser(description="PQC-LEO Results Parsing Tool")
-    parser.add_argument('--parse-mode', type=str, help='The parsing mode to be used (computational or tls)')
-    parser.add_argument('--machine-id', type=int, help='The Machine-ID of the results to be parsed')
-    parser.add_argument('--total-runs', type=int, help='The number of test runs to be parsed')
-    parser.add_argument("--replace-old-results", action="store_true", help="Replace old results for the passed Machine-ID if this flag is set")
-    
-    # Parse the command line arguments
+def get_parser(parse_mode):
+    """ Helper function for getting the parsing function for the passed parse mode. The parsing module is only imported 
+        the first time it is needed, so that a single mode run does not pay the import cost of the other parser. """
+
+    # Import the parsing module and store its parsing function if it has not been loaded yet
+    if parse_mode not in LOADED_PARSERS:
+        module_name, function_name = PARSER_MODULES[parse_mode]
+        LOADED_PARSERS[parse_mode] = getattr(importlib.import_module(module_name), function_name)
+
+    return LOADED_PARSERS[parse_mode]
+
+#------------------------------------------------------------------------------------------------------------------------------
+def non_negative_int(value):
+    """ Helper function used as an argparse type for validating that the passed Machine-ID is a non-negative integer. """
+
+    # Convert the value and check that it is not negative
     try:
-    
-        # Take in the command line arguments
-        args = parser.parse_args()
-        parse_mode = args.parse_mode
-        machine_id = args.machine_id
-        total_runs = args.total_runs 
-
-        # Check if the parse mode is valid (done manually to have custom error messages)
-        if parse_mode == 'both':
-            raise Exception("The --parse-mode argument cannot be set to 'both' for automatic parsing, please use the interactive mode from the terminal")
-        
-        elif parse_mode != "computational" and parse_mode != "tls":
-            raise Exception(f"Invalid parse mode provided to the script - {parse_mode}, please use 'computational' or 'tls'")
+        int_value = int(value)
+    except ValueError:
+        int_value = -1
 
-        # Determine if a machine-ID has been provided to the script
-        if machine_id is not None:
+    if int_value < 0:
+        raise argparse.ArgumentTypeError(f"invalid Machine-ID - {value}, please use a positive integer value")
 
-            # Check if the machine-ID is a valid integer
-            if machine_id < 0 or not isinstance(machine_id, int):
-                raise Exception(f"Invalid Machine-ID provided to the script - {machine_id}, please use a positive integer value")
-            
-        # Ensure that the number of runs is present and is a valid integer
-        if total_runs is not None and (total_runs < 1 or not isinstance(total_runs, int)):
-            raise Exception(f"Invalid number of runs provided to the script - {total_runs}, please use a positive integer value")
+    return int_value
+
+#------------------------------------------------------------------------------------------------------------------------------
+def positive_int(value):
+    """ Helper function used as an argparse type for validating that the passed number of test runs is a positive integer. """
+
+    # Convert the value and check that it is greater than 0
+    try:
+        int_value = int(value)
+    except ValueError:
+        int_value = 0
 
-        # Ensure that both arguments are provided if they are both valid
-        if machine_id is None or parse_mode is None or total_runs is None:
-            raise Exception("The --machine-id, --parse-mode, and --total-runs arguments must all be provided.")
+    if int_value < 1:
+        raise argparse.ArgumentTypeError(f"invalid number of runs - {value}, please use a positive integer value")
 
-    except Exception as error:
-        print(f"[ERROR] - {error}")
-        parser.print_help()
-        sys.exit(1)
+    return int_value
 
-    # Return the parsed arguments
-    return args
+#------------------------------------------------------------------------------------------------------------------------------
+def handle_args():
+    """ Function for handling command-line arguments for the script and returning the parsed arguments. The arguments are 
+        validated by argparse itself, which outputs the usage and exits if any of them are missing or invalid. """
+    
+    # Define the argument parser and the valid options for the script
+    parser = argparse.ArgumentParser(description="PQC-LEO Results Parsing Tool")
+    parser.add_argument('--parse-mode', type=str, choices=["computational", "tls"], required=True, help='The parsing mode to be used (computational or tls, both is only available in interactive mode)')
+    parser.add_argument('--machine-id', type=non_negative_int, required=True, help='The Machine-ID of the results to be parsed')
+    parser.add_argument('--total-runs', type=positive_int, required=True, help='The number of test runs to be parsed')
+    parser.add_argument("--replace-old-results", action="store_true", help="Replace old results for the passed Machine-ID if this flag is set")
+    parser.add_argument("--force", action="store_true", help="Re-parse all TLS runs even if kept old results already contain them")
+    parser.add_argument("--no-parquet", action="store_true", help="Disable writing the Parquet copies of the parsed TLS results")
+    parser.add_argument("--on-existing", type=str, choices=["replace", "abort", "wait", "keep"], help="How to handle existing parsed TLS results for the passed Machine-ID without prompting (replace, abort, wait or keep)")
+    
+    # Parse and return the command line arguments
+    return parser.parse_args()
 
 #------------------------------------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=1)
 def setup_base_env():
-    """ Function for setting up the global environment by determining the root path. It recursively moves up the directory 
-        tree until it finds the .pqc_leo_dir_marker.tmp file, then returns the root path. """
+    """ Function for setting up the global environment by determining the root path. It moves up the directory tree 
+        until it finds the .pqc_leo_dir_marker.tmp file, then returns the root path. The root path is cached for the 
+        process and stored in the PQC_LEO_ROOT_DIR environment variable so later lookups do not need to walk the tree. """
 
-    # Determine the directory that the script is being executed from and set the marker filename
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    current_dir = script_dir
+    # Set the marker filename and check if a valid root path has already been stored in the environment
     marker_filename = ".pqc_leo_dir_marker.tmp"
+    env_root_dir = os.environ.get("PQC_LEO_ROOT_DIR")
 
-    # Continue moving up the directory tree until the .pqc_leo_dir_marker.tmp file is found
-    while True:
+    if env_root_dir and os.path.isfile(os.path.join(env_root_dir, marker_filename)):
+        return env_root_dir
 
-        # Check if the .pqc_leo_dir_marker.tmp file is present
-        if os.path.isfile(os.path.join(current_dir, marker_filename)):
-            root_dir = current_dir
-            return root_dir
+    # Determine the directory that the script is being executed from
+    script_dir = Path(__file__).resolve().parent
 
-        # Move up a directory and store the new path
-        current_dir = os.path.dirname(current_dir)
+    # Move up the directory tree until the .pqc_leo_dir_marker.tmp file is found
+    for current_dir in (script_dir, *script_dir.parents):
 
-        # If the system's root directory is reached and the file is not found, exit the script
-        if current_dir == "/":
-            print("Root directory path file not present, please ensure the path is correct and try again.")
-            sys.exit(1)
+        # Check if the .pqc_leo_dir_marker.tmp file is present and store the root path in the environment if so
+        if (current_dir / marker_filename).is_file():
+            root_dir = str(current_dir)
+            os.environ["PQC_LEO_ROOT_DIR"] = root_dir
+            return root_dir
+
+    # If the system's root directory is reached and the file is not found, exit the script
+    print("Root directory path file not present, please ensure the path is correct and try again.")
+    sys.exit(1)
 
 #------------------------------------------------------------------------------------------------------------------------------
 def get_mode_selection():
@@ -157,6 +182,54 @@ def get_test_opts(root_dir):
     test_opts = [machine_num, total_runs, root_dir]
     return test_opts
 
+#------------------------------------------------------------------------------------------------------------------------------
+def old_results_present(root_dir, comp_machine_id, tls_machine_id):
+    """ Helper function for determining if either of the parsers will find old parsed results for the passed Machine-IDs, 
+        in which case the user may need prompted on how to handle them. """
+
+    # Set the parsed results directories that each of the parsers will check for old results
+    comp_mach_results_dir = os.path.join(root_dir, "test_data", "results", "computational_performance", f"machine_{comp_machine_id}")
+    tls_mach_results_dir = os.path.join(root_dir, "test_data", "results", "tls_performance", f"machine_{tls_machine_id}")
+
+    # Return whether either of the parsed results directories already exists
+    return os.path.isdir(comp_mach_results_dir) or os.path.isdir(tls_mach_results_dir)
+
+#------------------------------------------------------------------------------------------------------------------------------
+def parse_both_results(comp_test_opts, tls_test_opts, replace_old_results):
+    """ Function for parsing both the computational and TLS performance results. As the parsers read and write disjoint 
+        directories, they are run in separate processes at the same time. Parsing is done sequentially instead if this 
+        has been requested or if old results are present, so that any prompts about the old results can be answered. """
+
+    # Load both of the parsing functions
+    parse_comp_performance = get_parser("computational")
+    parse_tls_performance = get_parser("tls")
+
+    # Determine if the parsers need to be ran sequentially
+    if PARSE_JOBS < 2 or old_results_present(comp_test_opts[2], comp_test_opts[0], tls_test_opts[0]):
+
+        # Parse the computational performance results
+        parse_comp_performance(comp_test_opts, replace_old_results)
+        print("Computational Performance Parsing complete\n")
+
+        # Parse the TLS performance results
+        parse_tls_performance(tls_test_opts, replace_old_results)
+        print("TLS Performance Parsing complete\n")
+        return
+
+    # Run both of the parsers at the same time and output the completed message for each as it finishes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+
+        # Submit both of the parsers to the executor
+        futures = {
+            executor.submit(parse_comp_performance, comp_test_opts, replace_old_results): "Computational Performance",
+            executor.submit(parse_tls_performance, tls_test_opts, replace_old_results): "TLS Performance",
+        }
+
+        # Output the completed message for each parser, raising any errors that occurred within it
+        for future in as_completed(futures):
+            future.result()
+            print(f"{futures[future]} Parsing complete\n")
+
 #------------------------------------------------------------------------------------------------------------------------------
 def main():
     """ Main function for controlling the parsing of computational and TLS performance testing results. 
@@ -184,12 +257,12 @@ def main():
         if args.parse_mode == "computational":
             print("Parsing Computational Performance Results")
             comp_test_opts = [args.machine_id, args.total_runs, root_dir]
-            parse_comp_performance(comp_test_opts, replace_old_results)
+            get_parser("computational")(comp_test_opts, replace_old_results)
         
         elif args.parse_mode == "tls":
             print("Parsing TLS Performance Results")
             tls_test_opts = [args.machine_id, args.total_runs, root_dir]
-            parse_tls_performance(tls_test_opts, replace_old_results)
+            get_parser("tls")(tls_test_opts, replace_old_results, args.force, not args.no_parquet, args.on_existing)
 
     else:
 
@@ -210,7 +283,7 @@ def main():
             comp_test_opts = get_test_opts(root_dir)
 
             # Call the parsing script for Liboqs results
-            parse_comp_performance(comp_test_opts, replace_old_results)
+            get_parser("computational")(comp_test_opts, replace_old_results)
         
         elif user_parse_mode == '2':
 
@@ -222,7 +295,7 @@ def main():
             tls_test_opts = get_test_opts(root_dir)
 
             # Call the parsing script for OQS-Provider TLS results
-            parse_tls_performance(tls_test_opts, replace_old_results)
+            get_parser("tls")(tls_test_opts, replace_old_results)
 
         elif user_parse_mode == '3':
 
@@ -233,16 +306,17 @@ def main():
             print(f"Gathering testing parameters used for computational performance\n")
             comp_test_opts = get_test_opts(root_dir)
 
-            print(f"Gathering testing parameters for TLS performance testing\n")
-            tls_test_opts = get_test_opts(root_dir)
-            
-            # Parse the computational performance results
-            parse_comp_performance(comp_test_opts, replace_old_results)
-            print("Computational Performance Parsing complete\n")
+            # Determine if the same test options should be used for the TLS performance results
+            use_same_opts = input("Use the same Machine-ID and number of test runs for TLS performance? [Y/n] - ")
 
-            # Parse the TLS performance results
-            parse_tls_performance(tls_test_opts, replace_old_results)
-            print("TLS Performance Parsing complete\n")
+            if use_same_opts.strip().lower() in ["n", "no"]:
+                print(f"Gathering testing parameters for TLS performance testing\n")
+                tls_test_opts = get_test_opts(root_dir)
+            else:
+                tls_test_opts = comp_test_opts
+            
+            # Parse both the computational and TLS performance results
+            parse_both_results(comp_test_opts, tls_test_opts, replace_old_results)
 
         else:
             print(f"[ERROR] - Invalid value in the parsing mode variable - {user_parse_mode}")
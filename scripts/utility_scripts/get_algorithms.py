@@ -21,6 +21,7 @@ import os
 import subprocess
 import sys
 import re
+from pathlib import Path
 
 # Set the root directory path variable
 root_dir = ""
@@ -54,25 +55,22 @@ def setup_base_env():
     global root_dir, liboqs_build_dir, openssl_path, openssl_lib_dir, oqs_provider_path, oqs_provider_src_dir
 
     # Determine the directory that the script is being executed from and set the marker filename
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    current_dir = script_dir
+    script_dir = Path(__file__).resolve().parent
     marker_filename = ".pqc_leo_dir_marker.tmp"
 
-    # Continue moving up the directory tree until the .pqc_leo_dir_marker.tmp file is found
-    while True:
+    # Move up the directory tree until the .pqc_leo_dir_marker.tmp file is found, up to and including the filesystem anchor
+    for current_dir in (script_dir, *script_dir.parents):
 
         # Check if the .pqc_leo_dir_marker.tmp file is present
-        if os.path.isfile(os.path.join(current_dir, marker_filename)):
-            root_dir = current_dir
+        if (current_dir / marker_filename).is_file():
+            root_dir = str(current_dir)
             break
 
-        # Move up a directory and store the new path
-        current_dir = os.path.dirname(current_dir)
+    else:
 
         # If the system's root directory is reached and the file is not found, exit the script
-        if current_dir == "/":
-            print("Root directory path file not present, please ensure the path is correct and try again.")
-            sys.exit(1)
+        print("Root directory path file not present, please ensure the path is correct and try again.")
+        sys.exit(1)
 
     # Declare the global library directory path variables
     liboqs_build_dir = os.path.join(root_dir, "lib", "liboqs", "build", "tests")